@@ -13,6 +13,8 @@ import aiohttp
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
+from .core.exceptions import ConfigurationError
+
 env_file = os.getenv('ENV_FILE', '.env')
 load_dotenv(env_file)
 
@@ -32,6 +34,10 @@ WEATHERAPI_KEY = os.getenv('WEATHERAPI_KEY')
 
 CACHE_TTL_SECONDS: int = int(os.getenv('CACHE_TTL', '600'))  # 10 minutes default
 
+# Resolved city coordinates rarely change, so geocoding results live much longer
+GEOCODE_CACHE_TTL_SECONDS: int = int(os.getenv('GEOCODE_CACHE_TTL', '86400'))  # 24 hours default
+GEOCODE_CACHE_SIZE: int = int(os.getenv('GEOCODE_CACHE_SIZE', '1000'))
+
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
@@ -80,6 +86,9 @@ MAX_DELAY: float = float(os.getenv('MAX_DELAY', '16.0'))
 JITTER_FACTOR: float = float(os.getenv('JITTER_FACTOR', '0.1'))
 BACKOFF_MULTIPLIER: float = float(os.getenv('BACKOFF_MULTIPLIER', '2.0'))
 
+# After a provider exhausts all retries, skip it for this many seconds (negative cache)
+PROVIDER_FAILURE_COOLDOWN: float = float(os.getenv('PROVIDER_FAILURE_COOLDOWN', '30.0'))
+
 # ============================================================================
 # CONNECTION POOL CONFIGURATION
 # ============================================================================
@@ -88,6 +97,18 @@ CONNECTION_POOL_SIZE: int = int(os.getenv('CONNECTION_POOL_SIZE', '100'))
 CONNECTION_POOL_PER_HOST: int = int(os.getenv('CONNECTION_POOL_PER_HOST', '30'))
 CONNECTION_KEEPALIVE_TIMEOUT: int = int(os.getenv('CONNECTION_KEEPALIVE_TIMEOUT', '30'))
 
+# ============================================================================
+# CONCURRENCY CONFIGURATION
+# ============================================================================
+# Batch requests fan out (locations x providers) coroutines; bound them per provider
+
+MAX_BATCH_LOCATIONS: int = int(os.getenv('MAX_BATCH_LOCATIONS', '50'))
+PROVIDER_MAX_CONCURRENCY: int = int(os.getenv('PROVIDER_MAX_CONCURRENCY', '64'))
+
+# Aggregation returns as soon as MIN_PROVIDERS succeed, or when the deadline passes
+MIN_PROVIDERS: int = int(os.getenv('MIN_PROVIDERS', '2'))
+AGGREGATION_TIMEOUT: float = float(os.getenv('AGGREGATION_TIMEOUT', '10.0'))
+
 # ============================================================================
 # CONSTRUCTED CONFIGURATIONS
 # ============================================================================
@@ -125,7 +146,7 @@ PROVIDERS = {
     "openweather": {
         "name": "OpenWeatherMap",
         "weather_url": "https://api.openweathermap.org/data/2.5/weather",
-        "geocoding_url": "http://api.openweathermap.org/geo/1.0/direct"
+        "geocoding_url": "https://api.openweathermap.org/geo/1.0/direct"
     },
     "weatherapi": {
         "name": "WeatherAPI",
@@ -137,6 +158,12 @@ PROVIDERS = {
     }
 }
 
+# Early return needs at least one provider to succeed and cannot wait for more providers than exist
+if not 1 <= MIN_PROVIDERS <= len(PROVIDERS):
+    raise ConfigurationError(f"MIN_PROVIDERS must be between 1 and {len(PROVIDERS)}, got {MIN_PROVIDERS}")
+if not AGGREGATION_TIMEOUT > 0:
+    raise ConfigurationError(f"AGGREGATION_TIMEOUT must be greater than 0, got {AGGREGATION_TIMEOUT}")
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
@@ -145,6 +172,7 @@ def get_config_summary() -> Dict[str, Any]:
     """Get configuration summary for debugging"""
     return {
         "retry_config": RETRY_CONFIG,
+        "provider_failure_cooldown_seconds": PROVIDER_FAILURE_COOLDOWN,
         "rate_limits": RATE_LIMITS,
         "timeouts": {
             provider: {
@@ -154,6 +182,10 @@ def get_config_summary() -> Dict[str, Any]:
             for provider, timeout in TIMEOUTS.items()
         },
         "cache_ttl_seconds": CACHE_TTL_SECONDS,
+        "geocode_cache": {
+            "ttl_seconds": GEOCODE_CACHE_TTL_SECONDS,
+            "max_size": GEOCODE_CACHE_SIZE
+        },
         "log_level": LOG_LEVEL,
         "api_keys_configured": {
             "openweather": bool(OPENWEATHER_API_KEY),
@@ -163,5 +195,11 @@ def get_config_summary() -> Dict[str, Any]:
             "pool_size": CONNECTION_POOL_SIZE,
             "per_host": CONNECTION_POOL_PER_HOST,
             "keepalive_timeout": CONNECTION_KEEPALIVE_TIMEOUT
+        },
+        "concurrency": {
+            "max_batch_locations": MAX_BATCH_LOCATIONS,
+            "provider_max_concurrency": PROVIDER_MAX_CONCURRENCY,
+            "min_providers": MIN_PROVIDERS,
+            "aggregation_timeout_seconds": AGGREGATION_TIMEOUT
         }
     }
\ No newline at end of file
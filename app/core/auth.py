@@ -101,7 +101,7 @@ async def verify_normal_user(
             detail="Invalid API key"
         )
     
-    logger.debug(f"Access granted: {key} -> {get_user_role(key).value}")
+    logger.debug("Access granted: %s -> %s", key, get_user_role(key).value)
     return key
 
 async def verify_admin_user(
@@ -147,5 +147,5 @@ async def verify_admin_user(
             detail="Admin access required"
         )
     
-    logger.debug(f"Admin access granted: {key}")
+    logger.debug("Admin access granted: %s", key)
     return key
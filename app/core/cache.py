@@ -46,19 +46,8 @@ class WeatherCache:
         logger.info(f"Cache initialized: TTL={self._ttl}s, Max Size={self._max_size}")
     
     def _normalize_key(self, location: str) -> str:
-        """Normalize location key for consistent caching"""
-        normalized = location.strip().lower()
-        
-        # For coordinates, normalize precision
-        if ',' in normalized:
-            try:
-                parts = [float(p.strip()) for p in normalized.split(',')]
-                if len(parts) == 2:
-                    normalized = f"{parts[0]:.4f},{parts[1]:.4f}"
-            except ValueError:
-                pass  # Keep original if not valid coordinates
-                
-        return normalized
+        """Normalize location key for consistent caching (the service already canonicalizes coordinates)"""
+        return location.strip().lower()
     
     def get(self, location: str) -> Optional[Dict[str, Any]]:
         """Get cached weather data with error handling"""
@@ -67,11 +56,11 @@ class WeatherCache:
         try:
             data = self._cache[key]
             self._hits += 1
-            logger.debug(f"Cache hit: {key}")
+            logger.debug("Cache hit: %s", key)
             return data
         except KeyError:
             self._misses += 1
-            logger.debug(f"Cache miss: {key}")
+            logger.debug("Cache miss: %s", key)
             return None
         except Exception as e:
             # Handle any comparison errors from cachetools
@@ -85,7 +74,7 @@ class WeatherCache:
         
         try:
             self._cache[key] = data
-            logger.debug(f"Cache set: {key}")
+            logger.debug("Cache set: %s", key)
         except Exception as e:
             logger.error(f"Cache set failed for {key}: {e}")
             # If caching fails, we can still continue without caching
@@ -67,7 +67,7 @@ def log_time(func):
             result = await func(*args, **kwargs)
             duration = round((time.perf_counter() - start) * 1000, 2)
             logger = get_logger(func.__module__)
-            logger.debug(f"⏱️ {func.__name__} took {duration}ms")
+            logger.debug("⏱️ %s took %sms", func.__name__, duration)
             return result
         except Exception as e:
             duration = round((time.perf_counter() - start) * 1000, 2)
@@ -82,7 +82,7 @@ def log_time(func):
             result = func(*args, **kwargs)
             duration = round((time.perf_counter() - start) * 1000, 2)
             logger = get_logger(func.__module__)
-            logger.debug(f"⏱️ {func.__name__} took {duration}ms")
+            logger.debug("⏱️ %s took %sms", func.__name__, duration)
             return result
         except Exception as e:
             duration = round((time.perf_counter() - start) * 1000, 2)
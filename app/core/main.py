@@ -17,6 +17,7 @@ Version: 1.0.0
 import os
 from dotenv import load_dotenv
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from .routes import router as weather_router
@@ -36,6 +37,8 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Weather Service")
     # Initialize global session
     await get_global_session()
+    # Build the OpenAPI schema now; FastAPI caches it, so /openapi.json never generates it on a request
+    app.openapi()
     yield
     # Clean up global session
     await close_global_session()
@@ -45,7 +48,8 @@ app = FastAPI(
     title="Weather Data Aggregation Service",
     description="Aggregates weather data from multiple providers with role-based authentication",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 app.include_router(weather_router, prefix="/api/v1")
@@ -60,7 +60,7 @@ class SimpleTokenBucket:
                     wait_time = time.time() - start_time
                     logger.info(f"{self.provider} rate limit wait completed: {wait_time:.2f}s")
                 
-                logger.debug(f"{self.provider} token consumed, {self.tokens:.1f} remaining")
+                logger.debug("%s token consumed, %.1f remaining", self.provider, self.tokens)
                 return
             
             if not wait_started:
@@ -18,6 +18,7 @@ Authentication:
 
 API Desgin:
     - Weather data aggregation -> GET /weather
+    - Batch weather data aggregation -> POST /weather/batch
     - Administrative configuration access -> GET /config
     - Cache management operations -> DELETE /cache
 
@@ -26,8 +27,9 @@ Version: 1.0.0
 """
 
 from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, Any
-from .service import WeatherAggregationService
+from pydantic import BaseModel, Field
+from typing import Dict, Any, List
+from .service import weather_service
 from .exceptions import (
     ValidationError, 
     ConfigurationError, 
@@ -37,12 +39,17 @@ from .exceptions import (
     RESPONSE_EXAMPLES
 )
 from .logger import get_logger
-from ..config import get_config_summary
+from ..config import get_config_summary, MAX_BATCH_LOCATIONS
 from .auth import verify_normal_user, verify_admin_user
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+
+class BatchWeatherRequest(BaseModel):
+    """Request body for batch weather lookups"""
+    locations: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_LOCATIONS)
+
 @router.get(
     "/weather",
     status_code=200,
@@ -159,12 +166,8 @@ async def get_weather(
         logger.warning("Empty location parameter")
         raise HTTPException(status_code=400, detail="Location parameter is required")
     
-    weather_service = None
     try:
-        # Initialize the weather aggregation service
-        weather_service = WeatherAggregationService()
-        
-        # Fetch aggregated weather data from all providers
+        # Fetch aggregated weather data from all providers using the shared service instance
         result = await weather_service.get_aggregated_weather(location.strip())
         
         logger.info(f"Weather data request completed successfully for location: {location}")
@@ -185,6 +188,112 @@ async def get_weather(
         raise HTTPException(status_code=500, detail=error_message)
 
 
+@router.post(
+    "/weather/batch",
+    status_code=200,
+    responses={
+        200: {
+            "description": "Per-location weather results (success or error for each location)",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "count": 2,
+                        "results": [
+                            {
+                                "location": "Singapore",
+                                "status": "success",
+                                "data": {
+                                    "location": "Singapore",
+                                    "temperature": {"value": 28.6, "unit": "celsius", "method": "median"},
+                                    "humidity": 66.5,
+                                    "conditions": "overcast",
+                                    "sources": [
+                                        {"provider": "OpenWeatherMap", "status": "success", "response_time_ms": 263}
+                                    ],
+                                    "timestamp": "2025-09-14T20:56:54.675768+08:00"
+                                }
+                            },
+                            {
+                                "location": "1,2,3",
+                                "status": "error",
+                                "status_code": 400,
+                                "detail": "Invalid input: Too many commas. Use 'latitude,longitude' for coordinates"
+                            }
+                        ]
+                    }
+                }
+            }
+        },
+        401: {
+            "description": "Authentication required",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Not authenticated"}
+                }
+            }
+        },
+        422: RESPONSE_EXAMPLES[422]
+    },
+    tags=["Weather Data"],
+    summary="Get aggregated weather data for many locations",
+    description=f"""
+    Retrieve aggregated weather for up to {MAX_BATCH_LOCATIONS} locations in one request.
+    All locations are fetched concurrently over the shared connection pool.
+
+    Example body:
+    - {{"locations": ["Singapore", "1.3521,103.8198", "New York"]}}
+    
+    Authentication: Bearer Token Required
+    - Use `Authorization: Bearer 123` for normal user
+    - Use `Authorization: Bearer abc` for admin user
+    """
+)
+async def get_weather_batch(
+    request: BatchWeatherRequest,
+    api_key: str = Depends(verify_normal_user)
+) -> Dict[str, Any]:
+    """
+    Retrieve aggregated weather data for many locations in one request.
+    
+    Each location is processed exactly like GET /weather, but all of them are
+    fetched concurrently. A failing location does not fail the whole batch;
+    its entry carries the status code and error detail instead.
+    
+    Args:
+        request (BatchWeatherRequest): Locations to look up
+        api_key (str): Validated API key from authentication dependency
+        
+    Returns:
+        Dict[str, Any]: Per-location results in input order
+    """
+    logger.info(f"Batch weather request initiated for {len(request.locations)} locations")
+    
+    results = await weather_service.get_aggregated_weather_batch(request.locations)
+    
+    entries = []
+    for location, result in zip(request.locations, results):
+        if not isinstance(result, Exception):
+            entries.append({"location": location, "status": "success", "data": result})
+        elif isinstance(result, (ValidationError, ConfigurationError, ProviderError)):
+            entries.append({
+                "location": location,
+                "status": "error",
+                "status_code": get_status_code(result),
+                "detail": format_error(result)
+            })
+        else:
+            logger.error(f"Unexpected error processing batch weather request for {location}: {type(result).__name__}: {str(result)}")
+            entries.append({
+                "location": location,
+                "status": "error",
+                "status_code": 500,
+                "detail": f"Internal server error during weather data retrieval: {str(result)}"
+            })
+    
+    logger.info(f"Batch weather request completed for {len(entries)} locations")
+    return {"count": len(entries), "results": entries}
+
+
 @router.get(
     "/config",
     responses={
@@ -14,22 +14,26 @@ import asyncio
 import aiohttp
 import time
 from statistics import median
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from .cache import weather_cache
+from ..config import MIN_PROVIDERS, AGGREGATION_TIMEOUT
 from ..utils.utils import (
-    is_coordinates, 
     validate_input_format, 
+    validate_input_format_many,
     validate_api_keys,
     get_singapore_timestamp
 )
 from ..http.http_client import get_global_session
-from .exceptions import ProviderError
+from .exceptions import ProviderError, ValidationError
 from .logger import get_logger, log_time
 from ..providers import OpenWeatherProvider, WeatherAPIProvider, OpenMeteoProvider
 
 logger = get_logger(__name__)
 
+# Provider display names, indexed by the slot each provider's result occupies
+PROVIDER_NAMES = ("OpenWeatherMap", "WeatherAPI", "OpenMeteo")
+
 
 class WeatherAggregationService:
     """Weather aggregation service - focuses on provider integration and data aggregation"""
@@ -42,12 +46,13 @@ class WeatherAggregationService:
         logger.debug("Service initialized with refactored providers")
 
     @log_time
-    async def get_aggregated_weather(self, location: str) -> Dict[str, Any]:
+    async def get_aggregated_weather(self, location: str, *, validate: bool = True) -> Dict[str, Any]:
         """
         Main method to get aggregated weather data
         
         Args:
             location: str
+            validate: bool -> False skips input validation for locations already validated by the caller
             
         Returns:
             Dict[str, Any] -> aggregated weather data
@@ -57,6 +62,7 @@ class WeatherAggregationService:
             Exception
             
         Note:
+            - Coordinates are rewritten to a canonical 'lat,lon' string before the cache lookup
             - Cache is checked first
             - API keys are validated
             - Providers are fetched in parallel
@@ -66,7 +72,11 @@ class WeatherAggregationService:
         
         try:
             location = location.strip()
-            validate_input_format(location)
+            # Coordinates are parsed once here and threaded through to the providers
+            coords = validate_input_format(location, validate=validate)
+            if coords is not None:
+                # Every provider and the cache see one spelling per point, however it was typed
+                location = f"{coords[0]},{coords[1]}"
 
             # Cache check
             cached_data = weather_cache.get(location)
@@ -80,13 +90,13 @@ class WeatherAggregationService:
             # Validate API keys
             openweather_api_key, weatherapi_key = validate_api_keys()
             
-            is_coords = is_coordinates(location)
+            is_coords = coords is not None
             
             # Get global session with connection pooling
             session = await get_global_session()
             
             # Fetch from all providers
-            results = await self._fetch_all_providers(session, location, is_coords, openweather_api_key, weatherapi_key)
+            results = await self._fetch_all_providers(session, location, is_coords, openweather_api_key, weatherapi_key, coords)
             
             # Process results to get both successful data and all source info
             weather_data, all_sources = self._process_results(results)
@@ -113,10 +123,47 @@ class WeatherAggregationService:
             logger.error(f"get_aggregated_weather failed after {elapsed_time}ms: {str(e)}")
             raise
     
+    async def get_aggregated_weather_batch(self, locations: List[str]) -> List[Any]:
+        """
+        Get aggregated weather data for many locations concurrently
+        
+        Args:
+            locations: List[str]
+            
+        Returns:
+            List[Any] -> one entry per input location, in order: the aggregated
+            weather data, or the exception raised for that location
+            
+        Note:
+            - Duplicate locations are fetched once and shared
+            - All locations are validated once up front; invalid ones never reach the providers
+            - All (locations x providers) calls share the global session and pool
+            - Per-provider concurrency is bounded inside make_api_request
+        """
+        unique_locations = list(dict.fromkeys(location.strip() for location in locations))
+        logger.info(f"Batch request: {len(locations)} locations ({len(unique_locations)} unique)")
+        
+        by_location: Dict[str, Any] = {}
+        valid_locations = []
+        for location, validated in zip(unique_locations, validate_input_format_many(unique_locations)):
+            if isinstance(validated, ValidationError):
+                by_location[location] = validated
+            else:
+                valid_locations.append(location)
+        
+        results = await asyncio.gather(
+            *(self.get_aggregated_weather(location, validate=False) for location in valid_locations),
+            return_exceptions=True
+        )
+        by_location.update(zip(valid_locations, results))
+        
+        return [by_location[location.strip()] for location in locations]
+    
     async def _fetch_all_providers(self, session: aiohttp.ClientSession, location: str, is_coords: bool, 
-                                  openweather_key: str, weatherapi_key: str) -> List[Any]:
+                                  openweather_key: str, weatherapi_key: str,
+                                  coords: Optional[Tuple[float, float]] = None) -> List[Any]:
         """
-        Fetch from all providers in parallel
+        Fetch from all providers in parallel, returning early once enough succeed
         
         Args:
             session: aiohttp.ClientSession
@@ -124,35 +171,78 @@ class WeatherAggregationService:
             is_coords: bool
             openweather_key: str
             weatherapi_key: str
+            coords: Optional[Tuple[float, float]] -> pre-parsed (lat, lon) for coordinate input
             
         Returns:
-            List[Any] -> combined results from all providers
+            List[Any] -> one result per provider, in provider order
             
         Raises:
             Exception
+            
+        Note:
+            - Returns as soon as MIN_PROVIDERS providers succeed or AGGREGATION_TIMEOUT passes
+            - Providers still running at that point are cancelled and reported as skipped
         """
+        providers = (self.openweather_provider, self.weatherapi_provider, self.openmeteo_provider)
         tasks = [
-            self.openweather_provider.fetch_weather(session, location, is_coords, openweather_key),
-            self.weatherapi_provider.fetch_weather(session, location, is_coords, weatherapi_key),
-            self.openmeteo_provider.fetch_weather(session, location, is_coords, openweather_key)
+            asyncio.create_task(self.openweather_provider.fetch_weather(session, location, is_coords, openweather_key, coords)),
+            asyncio.create_task(self.weatherapi_provider.fetch_weather(session, location, is_coords, weatherapi_key, coords)),
+            asyncio.create_task(self.openmeteo_provider.fetch_weather(session, location, is_coords, openweather_key, coords))
         ]
         
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + AGGREGATION_TIMEOUT
+        pending = set(tasks)
+        successes = 0
+        
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.cancelled() or task.exception() is not None:
+                        continue
+                    result = task.result()
+                    if result and result.get("source", {}).get("status") == "success":
+                        successes += 1
+                if successes >= MIN_PROVIDERS:
+                    break
+        finally:
+            # asyncio.wait never cancels what it waits on, so stop every unfinished provider
+            # on all exit paths, including cancellation of this coroutine (client disconnect)
+            for task in pending:
+                task.cancel()
+        
+        # One slot per provider, filled in place
+        results: List[Any] = [None] * len(tasks)
+        for slot, (provider, task) in enumerate(zip(providers, tasks)):
+            if task in pending:
+                status = "skipped - enough providers responded" if successes >= MIN_PROVIDERS else "skipped - aggregation timeout"
+                results[slot] = {"source": {"provider": provider.provider_name, "status": status, "response_time_ms": 0}}
+            elif task.cancelled():
+                results[slot] = {"source": {"provider": provider.provider_name, "status": "cancelled", "response_time_ms": 0}}
+            else:
+                results[slot] = task.exception() or task.result()
+        
+        return results
     
     def _process_results(self, results: List[Any]) -> tuple[List[Dict], List[Dict]]:
         """Process provider results and return both successful data and all source info"""
         weather_data = []
         all_sources = []
-        providers = ["OpenWeatherMap", "WeatherAPI", "OpenMeteo"]
         
-        for i, result in enumerate(results):
-            provider = providers[i]
-            
+        for provider, result in zip(PROVIDER_NAMES, results):
             if result and not isinstance(result, Exception) and "source" in result:
                 if result["source"]["status"] == "success":
                     logger.info(f"✓ {provider} success")
                     weather_data.append(result)
                     all_sources.append(result["source"])
+                elif result["source"]["status"].startswith(("skipped", "cancelled")):
+                    # Cut short by the early return, not a provider failure
+                    logger.debug(f"- {provider} {result['source']['status']}")
+                    all_sources.append(result["source"])
                 else:
                     logger.warning(f"✗ {provider} failed: {result['source']['status']}")
                     all_sources.append(result["source"])
@@ -183,21 +273,35 @@ class WeatherAggregationService:
         """
         # Calculate aggregated values
         logger.debug("Building response")
-        temperatures = [data["temperature"] for data in weather_data if data["temperature"] is not None]
+        # Collect every aggregated field in a single pass over the provider data
+        temperatures = []
+        humidity_total = 0
+        humidity_count = 0
+        description_counts: Dict[str, int] = {}
+        for data in weather_data:
+            temperature = data["temperature"]
+            if temperature is not None:
+                temperatures.append(temperature)
+            humidity = data["humidity"]
+            if humidity is not None:
+                humidity_total += humidity
+                humidity_count += 1
+            description = data["description"]
+            if description is not None:
+                description_counts[description] = description_counts.get(description, 0) + 1
+
         median_temp = median(temperatures) if temperatures else None
 
         # Calculate average humidity
-        humidities = [data["humidity"] for data in weather_data if data["humidity"] is not None]
-        average_humidity = sum(humidities) / len(humidities) if humidities else None
+        average_humidity = humidity_total / humidity_count if humidity_count else None
 
-        # Calculate most common weather description
-        descriptions = [data["description"] for data in weather_data if data["description"] is not None]
-        if not descriptions:
+        # Calculate most common weather description (first seen wins ties)
+        if not description_counts:
             most_common_description = "Weather data unavailable"
         else:
-            most_common_description = max(set(descriptions), key=descriptions.count)
+            most_common_description = max(description_counts, key=description_counts.__getitem__)
 
-        logger.debug(f"Aggregated Done, {len(weather_data)} sources")
+        logger.debug("Aggregated Done, %s sources", len(weather_data))
     
         # Return aggregated response
         return {
@@ -212,3 +316,7 @@ class WeatherAggregationService:
             "sources": all_sources,  # includes all providers (success + failure)
             "timestamp": get_singapore_timestamp(),
         }
+
+
+# Global service instance shared by all requests (providers are stateless between calls)
+weather_service = WeatherAggregationService()
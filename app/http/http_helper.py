@@ -9,14 +9,16 @@ Version: 1.0.0
 """
 import random
 import aiohttp
+import orjson
 import asyncio
 import time
 import logging
 from typing import Dict, Any, Optional
 
 # Import configurations from config module
-from ..config import TIMEOUTS, RATE_LIMITS, RETRY_CONFIG
+from ..config import TIMEOUTS, RATE_LIMITS, RETRY_CONFIG, PROVIDER_MAX_CONCURRENCY, PROVIDER_FAILURE_COOLDOWN
 from ..core.rate_limiter import SimpleTokenBucket
+from ..utils.weather_code import standardize_code
 
 # Setup logger for this module
 logger = logging.getLogger(__name__)
@@ -24,6 +26,12 @@ logger = logging.getLogger(__name__)
 # Global token buckets for each provider
 _buckets = {}
 
+# Global concurrency limits for each provider
+_semaphores = {}
+
+# Negative cache: provider name -> monotonic time until which it is skipped
+_failed_until: Dict[str, float] = {}
+
 def get_bucket(provider: str) -> SimpleTokenBucket:
     """Get or create token bucket for provider"""
     if provider not in _buckets:
@@ -32,6 +40,48 @@ def get_bucket(provider: str) -> SimpleTokenBucket:
     return _buckets[provider]
 
 
+def get_semaphore(provider: str) -> asyncio.Semaphore:
+    """Get or create the semaphore bounding in-flight requests for provider"""
+    if provider not in _semaphores:
+        _semaphores[provider] = asyncio.Semaphore(PROVIDER_MAX_CONCURRENCY)
+        logger.debug(f"Created new semaphore for {provider}: {PROVIDER_MAX_CONCURRENCY} concurrent requests")
+    return _semaphores[provider]
+
+
+def _check_provider_available(provider_name: str) -> bool:
+    """
+    Check the negative cache before calling a provider.
+    
+    Returns False while the provider is cooling down after a failure. Once the
+    cooldown expires, the first caller is let through as a probe and the
+    cooldown is extended so concurrent callers keep skipping until the probe
+    reports back via _mark_provider_healthy/_mark_provider_failed.
+    """
+    failed_until = _failed_until.get(provider_name)
+    if failed_until is None:
+        return True
+    
+    now = time.monotonic()
+    if now < failed_until:
+        return False
+    
+    _failed_until[provider_name] = now + PROVIDER_FAILURE_COOLDOWN
+    logger.info(f"🔎 {provider_name} cooldown expired - sending probe request")
+    return True
+
+
+def _mark_provider_failed(provider_name: str) -> None:
+    """Skip provider for the cooldown period after it exhausted all retries"""
+    _failed_until[provider_name] = time.monotonic() + PROVIDER_FAILURE_COOLDOWN
+    logger.warning(f"🧊 {provider_name} marked unavailable for {PROVIDER_FAILURE_COOLDOWN}s")
+
+
+def _mark_provider_healthy(provider_name: str) -> None:
+    """Clear provider from the negative cache once it responds"""
+    if _failed_until.pop(provider_name, None) is not None:
+        logger.info(f"✅ {provider_name} available again")
+
+
 def calculate_retry_delay(attempt: int) -> float:
     """Calculate delay using exponential backoff with jitter"""
     base_delay = RETRY_CONFIG["base_delay"]
@@ -70,28 +120,43 @@ async def make_api_request(session: aiohttp.ClientSession, url: str, params: Dic
         Exception
         
     Note:
+        - Providers that recently exhausted all retries are skipped (negative cache)
         - Rate limiting is handled by the token bucket
+        - Concurrency per provider is bounded by a semaphore
         - Retry policy is handled by the retry delay
         - Timeout handling is handled by the timeout config
     """
+    if not _check_provider_available(provider_name):
+        last_error = "Provider temporarily unavailable after repeated failures"
+        logger.warning(f"🧊 {provider_name} skipped - still cooling down after failures")
+        return {
+            "provider": provider_name, 
+            "status": f"failure - {last_error}", 
+            "response_time_ms": 0,
+            "attempts": 0,
+            "data": None,
+            "error": last_error
+        }
+    
     logger.info(f"🌐 {provider_name} API request started")
-    logger.debug(f"{provider_name} URL: {url}")
-    logger.debug(f"{provider_name} params: {list(params.keys())}")  # Log param keys, not values (security)
+    logger.debug("%s URL: %s", provider_name, url)
+    logger.debug("%s params: %s", provider_name, list(params))  # Log param keys, not values (security)
     
     bucket = get_bucket(timeout_key)
+    semaphore = get_semaphore(timeout_key)
     
     # Wait for token (rate limiting)
-    logger.debug(f"{provider_name} waiting for rate limit token...")
+    logger.debug("%s waiting for rate limit token...", provider_name)
     await bucket.wait_for_token()
     total_start = time.perf_counter()
     last_error = "Unknown error"
     max_retries = RETRY_CONFIG["max_retries"]
     
-    logger.debug(f"{provider_name} starting request with max {max_retries} retries")
+    logger.debug("%s starting request with max %s retries", provider_name, max_retries)
     
     for attempt in range(max_retries + 1):
         attempt_num = attempt + 1
-        logger.debug(f"{provider_name} attempt {attempt_num}/{max_retries + 1}")
+        logger.debug("%s attempt %s/%s", provider_name, attempt_num, max_retries + 1)
         
         try:
             # Wait for retry delay if not first attempt
@@ -102,19 +167,21 @@ async def make_api_request(session: aiohttp.ClientSession, url: str, params: Dic
 
             start = time.perf_counter()
             timeout_config = TIMEOUTS[timeout_key]
-            logger.debug(f"{provider_name} timeout config: {timeout_config.total}s total, {timeout_config.connect}s connect")
+            logger.debug("%s timeout config: %ss total, %ss connect", provider_name, timeout_config.total, timeout_config.connect)
             
-            async with session.get(url, params=params, timeout=timeout_config) as response:
+            async with semaphore, session.get(url, params=params, timeout=timeout_config) as response:
                 elapsed = round((time.perf_counter() - start) * 1000, 0)
                 
-                logger.debug(f"{provider_name} HTTP {response.status} in {elapsed}ms")
+                logger.debug("%s HTTP %s in %sms", provider_name, response.status, elapsed)
                 
                 if response.status == 200:
                     try:
-                        data = await response.json()
+                        # Decode raw bytes with orjson instead of aiohttp's stdlib json path
+                        data = orjson.loads(await response.read())
                         total_elapsed = round((time.perf_counter() - total_start) * 1000, 0)
                         
                         logger.info(f"✅ {provider_name} success in {total_elapsed}ms (attempt {attempt_num})")
+                        _mark_provider_healthy(provider_name)
                         
                         return {
                             "provider": provider_name, 
@@ -154,6 +221,7 @@ async def make_api_request(session: aiohttp.ClientSession, url: str, params: Dic
                     total_elapsed = round((time.perf_counter() - total_start) * 1000, 0)
                     
                     logger.error(f"❌ {provider_name} client error {response.status} - not retrying")
+                    _mark_provider_healthy(provider_name)  # Provider is reachable, the request was rejected
                     
                     return {
                         "provider": provider_name, 
@@ -199,6 +267,7 @@ async def make_api_request(session: aiohttp.ClientSession, url: str, params: Dic
             logger.error(f"💥 {provider_name} unexpected error: {error_type} - {str(e)}")
             
             # Give token back for unexpected errors
+            # Not evidence either way about the provider, so leave its cooldown state as it is
             bucket.tokens = min(bucket.max_tokens, bucket.tokens + 1)
             total_elapsed = round((time.perf_counter() - total_start) * 1000, 0)
             
@@ -216,6 +285,7 @@ async def make_api_request(session: aiohttp.ClientSession, url: str, params: Dic
     final_error = f"Failed after {max_retries + 1} attempts: {last_error}"
     
     logger.error(f"❌ {provider_name} all retries exhausted: {final_error} (total: {total_elapsed}ms)")
+    _mark_provider_failed(provider_name)
     
     return {
         "provider": provider_name, 
@@ -226,29 +296,25 @@ async def make_api_request(session: aiohttp.ClientSession, url: str, params: Dic
     }
 
 
-def get_weather_description(mapping: Dict, code: int, fallback: str) -> str:
+def get_weather_description(provider_id: int, code: int, fallback: str) -> str:
     """
-    Get weather description from standard mapping with fallback
+    Get weather description from the standard code table with fallback
     
     Args:
-        mapping: Dict
+        provider_id: int
         code: int
         fallback: str
 
     Returns:
         str
         
-    Raises:
-        KeyError
-        
     Note:
-        - Mapping is used to map weather codes to descriptions
-        - Fallback is used when the code is not found in the mapping
+        - The combined code table maps (provider_id, code) to standard condition strings
+        - Fallback is used when the code is not found in the table
     """
-    try:
-        description = mapping[code].value
-        logger.debug(f"Weather code {code} mapped to: {description}")
-        return description
-    except KeyError:
-        logger.debug(f"Weather code {code} not found in mapping, using fallback: {fallback}")
-        return fallback
\ No newline at end of file
+    description = standardize_code(provider_id, code)
+    if description is None:
+        logger.debug("Weather code %s not found in mapping, using fallback: %s", code, fallback)
+        return fallback
+    logger.debug("Weather code %s mapped to: %s", code, description)
+    return description
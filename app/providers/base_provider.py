@@ -21,6 +21,7 @@ import aiohttp
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, Tuple
 from ..http.http_helper import make_api_request, get_weather_description
+from ..utils.weather_code import PROVIDER_IDS
 from ..core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -41,6 +42,7 @@ class BaseWeatherProvider(ABC):
     Attributes:
         provider_name (str): Human-readable name of the weather provider
         timeout_key (str): Configuration key for timeout settings lookup
+        provider_id (Optional[int]): Index into the standard code table, None if unmapped
         
     Example:
         class MyWeatherProvider(BaseWeatherProvider):
@@ -66,10 +68,12 @@ class BaseWeatherProvider(ABC):
             
         Note:
             The timeout_key should correspond to an entry in the TIMEOUTS configuration
-            dictionary defined in the config module.
+            dictionary defined in the config module. It also selects the provider's
+            block in the standard weather code table.
         """
         self.provider_name = provider_name
         self.timeout_key = timeout_key
+        self.provider_id = PROVIDER_IDS.get(timeout_key)
         logger.debug(f"{provider_name} provider initialized")
     
     async def fetch_weather(
@@ -77,7 +81,8 @@ class BaseWeatherProvider(ABC):
         session: aiohttp.ClientSession, 
         location: str,
         is_coords: bool, 
-        api_key: str
+        api_key: str,
+        coords: Optional[Tuple[float, float]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Fetch weather data from the provider's API. For openweather and weatherapi only
@@ -91,6 +96,8 @@ class BaseWeatherProvider(ABC):
             location (str): Location query (city name or coordinates)
             is_coords (bool): Whether location represents coordinates (lat,lon)
             api_key (str): API key for authenticating with the provider
+            coords (Optional[Tuple[float, float]]): Pre-parsed (lat, lon) for coordinate
+                input, so the location string does not need to be parsed again
             
         Returns:
             Optional[Dict[str, Any]]: Standardized weather data dictionary or None on failure
@@ -103,13 +110,13 @@ class BaseWeatherProvider(ABC):
         Raises:
             Exception: Propagates any unhandled exceptions from the API request
         """
-        logger.debug(f"Starting weather data fetch for {self.provider_name}")
-        logger.debug(f"Location: {location}, Coordinates: {is_coords}")
+        logger.debug("Starting weather data fetch for %s", self.provider_name)
+        logger.debug("Location: %s, Coordinates: %s", location, is_coords)
         
         try:
             # Step 1: Prepare provider-specific request parameters
-            url, params = self._prepare_request_params(location, is_coords, api_key)
-            logger.debug(f"{self.provider_name} prepared request: URL={url}")
+            url, params = self._prepare_request_params(location, is_coords, api_key, coords)
+            logger.debug("%s prepared request: URL=%s", self.provider_name, url)
             
             # Step 2: Execute the API request with retry and rate limiting
             result = await make_api_request(
@@ -122,7 +129,7 @@ class BaseWeatherProvider(ABC):
             
             # Step 3: Process the response based on success/failure status
             if result["status"] == "success":
-                logger.debug(f"{self.provider_name} API request successful")
+                logger.debug("%s API request successful", self.provider_name)
                 return self._process_successful_response(result)
             else:
                 logger.error(f"{self.provider_name} API request failed: {result}")
@@ -137,10 +144,14 @@ class BaseWeatherProvider(ABC):
         self, 
         location: str, 
         is_coords: bool, 
-        api_key: str
+        api_key: str,
+        coords: Optional[Tuple[float, float]] = None
     ) -> Tuple[str, Dict[str, Any]]:
         """
         Prepare provider-specific URL and parameters for the API request.
+        
+        When coords is given it holds the already-parsed (lat, lon) of a coordinate
+        location and should be used instead of parsing the location string.
         """
         pass
     
@@ -181,7 +192,6 @@ class BaseWeatherProvider(ABC):
     
     def _get_weather_description(
         self, 
-        mapping: Dict[int, Any], 
         code: int, 
         fallback: str
     ) -> str:
@@ -189,22 +199,22 @@ class BaseWeatherProvider(ABC):
         Get standardized weather description from provider-specific weather code.
         
         This utility method maps provider-specific weather condition codes to
-        standardized weather descriptions using predefined mapping dictionaries.
+        standardized weather descriptions using the combined standard code table.
         
         Args:
-            mapping (Dict[int, Any]): Weather code to description mapping
             code (int): Provider-specific weather condition code
-            fallback (str): Default description if code is not found in mapping
+            fallback (str): Default description if code is not found in table
             
         Returns:
             str: Standardized weather condition description
             
         Example:
             description = self._get_weather_description(
-                OPENWEATHER_CODE_MAPPING, 
                 800,  # Clear sky code
                 "Unknown"
             )
             # Returns: "clear"
         """
-        return get_weather_description(mapping, code, fallback)
+        if self.provider_id is None:
+            return fallback
+        return get_weather_description(self.provider_id, code, fallback)
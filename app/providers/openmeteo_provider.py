@@ -3,8 +3,8 @@ OpenMeteo provider implementation with geocoding support
 """
 from typing import Dict, Any, Tuple, Optional
 import aiohttp
-from ..config import PROVIDERS
-from ..utils.weather_code import OPENMETEO_CODE_MAPPING
+from cachetools import TTLCache
+from ..config import PROVIDERS, GEOCODE_CACHE_TTL_SECONDS, GEOCODE_CACHE_SIZE
 from ..utils.utils import parse_coordinates
 from ..http.http_helper import make_api_request
 from ..core.logger import get_logger
@@ -12,6 +12,9 @@ from .base_provider import BaseWeatherProvider
 
 logger = get_logger(__name__)
 
+# Shared city -> (lat, lon) lookups so repeat city queries skip the geocoding round trip
+_geocode_cache: TTLCache = TTLCache(maxsize=GEOCODE_CACHE_SIZE, ttl=GEOCODE_CACHE_TTL_SECONDS)
+
 
 class OpenMeteoProvider(BaseWeatherProvider):
     """OpenMeteo weather provider with geocoding support"""
@@ -20,7 +23,8 @@ class OpenMeteoProvider(BaseWeatherProvider):
         super().__init__("OpenMeteo", "openmeteo")
     
     async def fetch_weather(self, session: aiohttp.ClientSession, location: str, 
-                           is_coords: bool, api_key: str) -> Optional[Dict[str, Any]]:
+                           is_coords: bool, api_key: str,
+                           coords: Optional[Tuple[float, float]] = None) -> Optional[Dict[str, Any]]:
         """
         [Over-ride] Override to handle geocoding for city names for openmeteo case
 
@@ -29,6 +33,7 @@ class OpenMeteoProvider(BaseWeatherProvider):
             location: str
             is_coords: bool
             api_key: str
+            coords: Optional[Tuple[float, float]] -> pre-parsed (lat, lon) for coordinate input
             
         Returns:
             Optional[Dict[str, Any]] -> weather data
@@ -38,12 +43,12 @@ class OpenMeteoProvider(BaseWeatherProvider):
             
         Note:
             - OpenMeteo API is used to fetch weather data using coordinates
-            - If city name is provided, it is geocoded to coordinates first
+            - If city name is provided, it is geocoded to coordinates first (cached)
             - If coordinates are provided, it is used directly
         """
         try:
             if is_coords:
-                lat, lon = parse_coordinates(location)
+                lat, lon = coords if coords is not None else parse_coordinates(location)
                 return await self._fetch_with_coordinates(session, lat, lon)
             else:
                 # Geocode first
@@ -68,7 +73,7 @@ class OpenMeteoProvider(BaseWeatherProvider):
         Returns:
             Optional[Dict[str, Any]] -> weather data
         """
-        url, params = self._prepare_request_params(f"{lat},{lon}", True, "")
+        url, params = self._prepare_request_params(f"{lat},{lon}", True, "", (lat, lon))
         result = await make_api_request(session, url, params, self.timeout_key, self.provider_name)
         
         if result["status"] == "success":
@@ -77,14 +82,15 @@ class OpenMeteoProvider(BaseWeatherProvider):
             logger.error(f"✗ {self.provider_name} failed: {result}")
             return self._create_failure_response(result)
     
-    def _prepare_request_params(self, location: str, is_coords: bool, api_key: str) -> Tuple[str, Dict[str, Any]]:
+    def _prepare_request_params(self, location: str, is_coords: bool, api_key: str,
+                                coords: Optional[Tuple[float, float]] = None) -> Tuple[str, Dict[str, Any]]:
         """
         [Over-ride] Prepare OpenMeteo request parameters
         """
         url = PROVIDERS["openmeteo"]["weather_url"]
         
         if is_coords:
-            lat, lon = parse_coordinates(location)
+            lat, lon = coords if coords is not None else parse_coordinates(location)
             params = {"latitude": lat, "longitude": lon, "current_weather": "true"}
         else:
             # This shouldn't be called for city names, but provide fallback
@@ -100,7 +106,6 @@ class OpenMeteoProvider(BaseWeatherProvider):
         current = data["current_weather"]
         weather_code = current["weathercode"]
         description = self._get_weather_description(
-            OPENMETEO_CODE_MAPPING, 
             weather_code, 
             f"Weather code {weather_code}"
         )
@@ -135,8 +140,16 @@ class OpenMeteoProvider(BaseWeatherProvider):
             
         Note:
             - OpenWeatherMap geocoding API is used to geocode city names to coordinates
+            - Successful lookups are cached, so only the first query for a city pays
+              the extra geocoding round trip before the OpenMeteo call
         """
-        logger.debug(f"Geocoding: {city_name}")
+        cache_key = city_name.strip().lower()
+        cached = _geocode_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Geocode cache hit: %s", city_name)
+            return cached
+        
+        logger.debug("Geocoding: %s", city_name)
         
         try:
             url = PROVIDERS["openweather"]["geocoding_url"]
@@ -146,8 +159,10 @@ class OpenMeteoProvider(BaseWeatherProvider):
             
             if result["status"] == "success" and result["data"]:
                 data = result["data"][0]
-                logger.debug(f"Geocoded to: {data['lat']}, {data['lon']}")
-                return data["lat"], data["lon"]
+                logger.debug("Geocoded to: %s, %s", data['lat'], data['lon'])
+                coords = data["lat"], data["lon"]
+                _geocode_cache[cache_key] = coords
+                return coords
                 
         except Exception as e:
             logger.error(f"Geocoding error: {e}")
@@ -1,10 +1,9 @@
 """
 OpenWeatherMap provider implementation
 """
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Tuple, Optional
 import aiohttp
 from ..config import PROVIDERS
-from ..utils.weather_code import OPENWEATHER_CODE_MAPPING
 from ..utils.utils import parse_coordinates
 from ..core.logger import get_logger
 from .base_provider import BaseWeatherProvider
@@ -18,14 +17,15 @@ class OpenWeatherProvider(BaseWeatherProvider):
     def __init__(self):
         super().__init__("OpenWeatherMap", "openweather")
     
-    def _prepare_request_params(self, location: str, is_coords: bool, api_key: str) -> Tuple[str, Dict[str, Any]]:
+    def _prepare_request_params(self, location: str, is_coords: bool, api_key: str,
+                                coords: Optional[Tuple[float, float]] = None) -> Tuple[str, Dict[str, Any]]:
         """
         [Over-ride] Prepare OpenWeatherMap request parameters
         """
         url = PROVIDERS["openweather"]["weather_url"]
 
         if is_coords:
-            lat, lon = parse_coordinates(location)
+            lat, lon = coords if coords is not None else parse_coordinates(location)
             params = {"lat": lat, "lon": lon, "appid": api_key, "units": "metric"}
         else:
             params = {"q": location, "appid": api_key, "units": "metric"}
@@ -39,7 +39,6 @@ class OpenWeatherProvider(BaseWeatherProvider):
         data = result["data"]
         weather_id = data["weather"][0]["id"]
         description = self._get_weather_description(
-            OPENWEATHER_CODE_MAPPING, 
             weather_id, 
             data["weather"][0]["description"]
         )
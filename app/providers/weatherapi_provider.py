@@ -1,10 +1,9 @@
 """
 WeatherAPI provider implementation
 """
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Tuple, Optional
 import aiohttp
 from ..config import PROVIDERS
-from ..utils.weather_code import WEATHERAPI_CODE_MAPPING
 from .base_provider import BaseWeatherProvider
 
 
@@ -14,7 +13,8 @@ class WeatherAPIProvider(BaseWeatherProvider):
     def __init__(self):
         super().__init__("WeatherAPI", "weatherapi")
     
-    def _prepare_request_params(self, location: str, is_coords: bool, api_key: str) -> Tuple[str, Dict[str, Any]]:
+    def _prepare_request_params(self, location: str, is_coords: bool, api_key: str,
+                                coords: Optional[Tuple[float, float]] = None) -> Tuple[str, Dict[str, Any]]:
         """
         [Over-ride] Prepare WeatherAPI request parameters
         """
@@ -30,7 +30,6 @@ class WeatherAPIProvider(BaseWeatherProvider):
         current = data["current"]
         condition_code = current["condition"]["code"]
         description = self._get_weather_description(
-            WEATHERAPI_CODE_MAPPING, 
             condition_code, 
             current["condition"]["text"]
         )
@@ -22,7 +22,8 @@ Author: Li Beiji
 Version: 1.0.0
 """
 import re
-from typing import Tuple
+from math import isfinite
+from typing import List, Optional, Tuple, Union
 from datetime import datetime, timezone, timedelta
 from ..config import OPENWEATHER_API_KEY, WEATHERAPI_KEY
 from ..core.exceptions import ValidationError, ConfigurationError
@@ -35,9 +36,68 @@ LATITUDE_MAX = 90.0
 LONGITUDE_MIN = -180.0
 LONGITUDE_MAX = 180.0
 
-# Regular Expression Patterns
-COORDINATE_PATTERN = r'^-?\d+(?:\.\d+)?,-?\d+(?:\.\d+)?$'
+# Compiled once; validate_city_name runs on every city lookup.
+# Matches any Unicode letter (a word character that is not a digit or underscore)
+_LETTER_RE = re.compile(r'[^\W\d_]')
+
+# Timezone Constants
 SINGAPORE_UTC_OFFSET = 8  # Singapore is UTC+8
+SINGAPORE_TZ = timezone(timedelta(hours=SINGAPORE_UTC_OFFSET))
+
+# get_singapore_timestamp precision -> datetime.isoformat timespec
+TIMESTAMP_PRECISIONS = {
+    'seconds': 'seconds',
+    'millis': 'milliseconds',
+    'microseconds': 'microseconds',
+}
+
+
+def _parse_coordinate_value(text: str) -> float:
+    """
+    Convert one coordinate half with float(), rejecting what float() is too lenient about.
+    
+    float() also accepts digit-group underscores ("1_0"), non-ASCII digits ("١")
+    and non-finite values ("nan", "inf"); none of those are coordinates.
+    Accepted: an optional sign, decimal digits with an optional fraction or
+    exponent ("1.5", "-.5", "+2", "1e1"), and surrounding whitespace.
+    
+    Raises:
+        ValueError: If the text is not an accepted coordinate number
+    """
+    if '_' in text or not text.isascii():
+        raise ValueError(f"Not a plain decimal number: {text!r}")
+    value = float(text)
+    if not isfinite(value):
+        raise ValueError(f"Coordinate value must be finite: {text!r}")
+    return value
+
+
+def _try_parse_coords(location: str) -> Optional[Tuple[float, float]]:
+    """
+    Split "latitude,longitude" and convert both halves to float in a single pass.
+    
+    Range checks are not applied here. Returns None when the string is not
+    exactly two numbers separated by one comma.
+    """
+    lat_str, sep, lon_str = location.partition(',')
+    if not sep or ',' in lon_str:
+        return None
+    
+    try:
+        return _parse_coordinate_value(lat_str), _parse_coordinate_value(lon_str)
+    except ValueError:
+        return None
+
+
+def _validate_coordinate_ranges(lat: float, lon: float) -> None:
+    """Raise ValidationError if latitude or longitude is outside its valid range"""
+    # Validate latitude range
+    if not (LATITUDE_MIN <= lat <= LATITUDE_MAX):
+        raise ValidationError(f"Latitude {lat} is out of range. Must be between {LATITUDE_MIN} and {LATITUDE_MAX}")
+    
+    # Validate longitude range  
+    if not (LONGITUDE_MIN <= lon <= LONGITUDE_MAX):
+        raise ValidationError(f"Longitude {lon} is out of range. Must be between {LONGITUDE_MIN} and {LONGITUDE_MAX}")
 
 
 def is_coordinates(location: str) -> bool:
@@ -55,9 +115,12 @@ def is_coordinates(location: str) -> bool:
         
     Expected Format:
         - "latitude,longitude" (e.g., "1.29,103.85")
-        - Both values can be integers or floating-point numbers
+        - Both values can be integers or floating-point numbers, optionally
+          signed or in exponent form (e.g. "1e1")
+        - Only ASCII digits; underscores, "nan" and "inf" are rejected
         - Negative values are allowed for southern latitudes and western longitudes
         - Exactly one comma separator is required
+        - Whitespace around either value is ignored
         
     Examples:
         >>> is_coordinates("1.29,103.85")
@@ -69,14 +132,10 @@ def is_coordinates(location: str) -> bool:
         >>> is_coordinates("1.29,103.85,100")  # Too many values
         False
     """
-    location = location.strip()
-    
-    # Must contain exactly one comma
-    if location.count(',') != 1:
+    # Fast path: most lookups are plain city names with no comma at all
+    if ',' not in location:
         return False
-        
-    # Validate against coordinate pattern using regex
-    return bool(re.match(COORDINATE_PATTERN, location))
+    return _try_parse_coords(location) is not None
 
 
 def parse_coordinates(location: str) -> Tuple[float, float]:
@@ -89,27 +148,19 @@ def parse_coordinates(location: str) -> Tuple[float, float]:
     if not location:
         raise ValidationError("Coordinate string cannot be empty")
     
-    # Validate comma separator count
-    if location.count(',') != 1:
+    # Split on the comma without building a list; exactly one comma is required
+    lat_str, sep, lon_str = location.partition(',')
+    if not sep or ',' in lon_str:
         raise ValidationError("Coordinates must be in format 'latitude,longitude'")
     
-    # Split and parse coordinate components
-    parts = location.split(',')
-    
+    # Parse coordinate components (surrounding whitespace is ignored)
     try:
-        lat = float(parts[0].strip())
-        lon = float(parts[1].strip())
+        lat = _parse_coordinate_value(lat_str)
+        lon = _parse_coordinate_value(lon_str)
     except ValueError:
         raise ValidationError("Both latitude and longitude must be valid numbers")
     
-    # Validate latitude range
-    if not (LATITUDE_MIN <= lat <= LATITUDE_MAX):
-        raise ValidationError(f"Latitude {lat} is out of range. Must be between {LATITUDE_MIN} and {LATITUDE_MAX}")
-    
-    # Validate longitude range  
-    if not (LONGITUDE_MIN <= lon <= LONGITUDE_MAX):
-        raise ValidationError(f"Longitude {lon} is out of range. Must be between {LONGITUDE_MIN} and {LONGITUDE_MAX}")
-        
+    _validate_coordinate_ranges(lat, lon)
     return lat, lon
 
 
@@ -127,7 +178,7 @@ def validate_city_name(city_name: str) -> None:
         - Cannot be empty or whitespace-only
         - Minimum length: 2 characters
         - Maximum length: 100 characters  
-        - Must contain at least one alphabetic character
+        - Must contain at least one alphabetic character (any script)
         
     Examples:
         >>> validate_city_name("Singapore")  # Passes validation
@@ -136,25 +187,37 @@ def validate_city_name(city_name: str) -> None:
         >>> validate_city_name("A" * 101)    # Raises ValidationError - too long
     """
     city_name = city_name.strip()
+    length = len(city_name)
     
     # Check for empty input
-    if not city_name:
+    if not length:
         raise ValidationError("City name cannot be empty")
     
     # Validate minimum length requirement
-    if len(city_name) < MIN_CITY_NAME_LENGTH:
+    if length < MIN_CITY_NAME_LENGTH:
         raise ValidationError(f"City name must be at least {MIN_CITY_NAME_LENGTH} characters")
     
     # Validate maximum length requirement
-    if len(city_name) > MAX_CITY_NAME_LENGTH:
+    if length > MAX_CITY_NAME_LENGTH:
         raise ValidationError(f"City name too long (max {MAX_CITY_NAME_LENGTH} characters)")
     
     # Ensure at least one alphabetic character is present
-    if not re.search(r'[a-zA-Z]', city_name):
+    if not _LETTER_RE.search(city_name):
         raise ValidationError("City name must contain at least one letter")
 
 
-def validate_input_format(location: str) -> None:
+def _classify(location: str) -> Optional[Tuple[float, float]]:
+    """
+    Cheaply tell coordinates from city names without applying any validation rules.
+    
+    Returns the parsed (latitude, longitude) for "lat,lon" input and None otherwise.
+    """
+    if ',' not in location:
+        return None
+    return _try_parse_coords(location)
+
+
+def validate_input_format(location: str, *, validate: bool = True) -> Optional[Tuple[float, float]]:
     """
     Validate the format of a location input string.
     
@@ -163,6 +226,14 @@ def validate_input_format(location: str) -> None:
     
     Args:
         location (str): Location input to validate (city name or coordinates)
+        validate (bool): Apply the validation rules (default). Pass False only for
+            input that was already validated, e.g. by validate_input_format_many;
+            the input is then just classified and never rejected
+        
+    Returns:
+        Optional[Tuple[float, float]]: Parsed (latitude, longitude) when the input
+        is coordinates, None when it is a city name. Callers can reuse the parsed
+        values instead of parsing the same string again.
         
     Raises:
         ValidationError: If the input format is invalid or fails validation rules
@@ -176,32 +247,70 @@ def validate_input_format(location: str) -> None:
         >>> validate_input_format("1.29,103.85")    # Valid coordinates
         >>> validate_input_format("1,2,3")          # Raises ValidationError - too many commas
         >>> validate_input_format("")               # Raises ValidationError - empty input
+        >>> validate_input_format("", validate=False)  # None - trusted input is not checked
     """
+    if not validate:
+        return _classify(location)
+    
     # Validate input type
     if not isinstance(location, str):
         raise ValidationError("Location must be a string")
     
-    original_location = location
     location = location.strip()
     
     # Check for empty input after trimming
     if not location:
         raise ValidationError("Location cannot be empty")
     
-    # Determine input type based on comma count and apply appropriate validation
+    # Count commas once and branch: none -> city name, one -> coordinates, more -> invalid
     comma_count = location.count(',')
-    
-    if comma_count == 0:
-        # Single value: treat as city name
+    if not comma_count:
         validate_city_name(location)
-    elif comma_count == 1:
-        # Two values: treat as coordinates
-        if not is_coordinates(location):
-            raise ValidationError("Invalid coordinate format")
-        parse_coordinates(location)  # Validate coordinate ranges
-    else:
-        # Too many values: invalid format
+        return None
+    
+    if comma_count > 1:
         raise ValidationError("Too many commas. Use 'latitude,longitude' for coordinates")
+    
+    # Exactly one comma: split and convert in one pass, then check ranges
+    coords = _try_parse_coords(location)
+    if coords is None:
+        raise ValidationError("Invalid coordinate format")
+    
+    _validate_coordinate_ranges(*coords)
+    return coords
+
+
+def validate_input_format_many(locations: List[str]) -> List[Union[Optional[Tuple[float, float]], ValidationError]]:
+    """
+    Validate many location input strings in one call.
+    
+    Each location goes through the same rules as validate_input_format, but a
+    failure does not stop the batch: the ValidationError is returned in that
+    location's slot instead of being raised (like asyncio.gather with
+    return_exceptions=True).
+    
+    Args:
+        locations (List[str]): Location inputs to validate
+        
+    Returns:
+        List[Union[Optional[Tuple[float, float]], ValidationError]]: One entry per
+        input, in order: parsed (latitude, longitude) for coordinates, None for
+        a valid city name, or the ValidationError for an invalid input
+        
+    Examples:
+        >>> validate_input_format_many(["Singapore", "1.29,103.85", ""])
+        [None, (1.29, 103.85), ValidationError('Location cannot be empty')]
+    """
+    # Bind the validator locally; the loop runs once per location in the batch
+    validate = validate_input_format
+    results: List[Union[Optional[Tuple[float, float]], ValidationError]] = []
+    append = results.append
+    for location in locations:
+        try:
+            append(validate(location))
+        except ValidationError as e:
+            append(e)
+    return results
 
 
 def validate_api_keys() -> Tuple[str, str]:
@@ -243,7 +352,7 @@ def validate_api_keys() -> Tuple[str, str]:
     return OPENWEATHER_API_KEY, WEATHERAPI_KEY
 
 
-def get_singapore_timestamp() -> str:
+def get_singapore_timestamp(precision: str = 'microseconds') -> str:
     """
     Generate a timestamp string in Singapore timezone (UTC+8).
     
@@ -251,22 +360,31 @@ def get_singapore_timestamp() -> str:
     ensuring all timestamps are normalized to Singapore time regardless of
     the server's local timezone configuration.
     
+    Args:
+        precision (str): Fractional-second precision, one of 'seconds',
+            'millis' or 'microseconds' (default)
+    
     Returns:
         str: ISO format timestamp string in Singapore timezone
         
+    Raises:
+        ValueError: If precision is not a supported value
+        
     Format:
-        The returned timestamp follows ISO 8601 format with timezone information:
+        The returned timestamp follows ISO 8601 format with timezone information.
+        The fractional part always has a fixed width for a given precision:
         "YYYY-MM-DDTHH:MM:SS.microseconds+08:00"
         
     Examples:
         >>> get_singapore_timestamp()
         "2024-01-15T14:30:25.123456+08:00"
+        >>> get_singapore_timestamp('seconds')
+        "2024-01-15T14:30:25+08:00"
     """
-    # Create Singapore timezone object (UTC+8)
-    singapore_tz = timezone(timedelta(hours=SINGAPORE_UTC_OFFSET))
-    
-    # Get current time in Singapore timezone
-    now = datetime.now(singapore_tz)
+    try:
+        timespec = TIMESTAMP_PRECISIONS[precision]
+    except KeyError:
+        raise ValueError(f"Unsupported timestamp precision: {precision}") from None
     
-    # Return ISO format timestamp with timezone information
-    return now.isoformat()
+    # Reuse the module-level Singapore timezone object (UTC+8)
+    return datetime.now(SINGAPORE_TZ).isoformat(timespec=timespec)
@@ -7,216 +7,297 @@ Author: Li Beiji
 Version: 1.0.0
 """
 
-from enum import Enum
-
-class StandardWeatherCondition(Enum):
-    """Standardized weather conditions"""
-    CLEAR = "clear"
-    PARTLY_CLOUDY = "partly_cloudy"
-    CLOUDY = "cloudy"
-    OVERCAST = "overcast"
-    FOG = "fog"
-    MIST = "mist"
-    LIGHT_RAIN = "light_rain"
-    MODERATE_RAIN = "moderate_rain"
-    HEAVY_RAIN = "heavy_rain"
-    DRIZZLE = "drizzle"
-    LIGHT_SNOW = "light_snow"
-    MODERATE_SNOW = "moderate_snow"
-    HEAVY_SNOW = "heavy_snow"
-    THUNDERSTORM = "thunderstorm"
-    THUNDERSTORM_WITH_RAIN = "thunderstorm_with_rain"
-    THUNDERSTORM_WITH_HAIL = "thunderstorm_with_hail"
-    RAIN_SHOWERS = "rain_showers"
-    SNOW_SHOWERS = "snow_showers"
-    SLEET = "sleet"
-    FREEZING_RAIN = "freezing_rain"
-    BLIZZARD = "blizzard"
-    SANDSTORM = "sandstorm"
-    UNKNOWN = "unknown"
-
-# Human-readable descriptions for each standard condition
-STANDARD_DESCRIPTIONS = {
-    StandardWeatherCondition.CLEAR: "Clear Sky",
-    StandardWeatherCondition.PARTLY_CLOUDY: "Partly Cloudy",
-    StandardWeatherCondition.CLOUDY: "Cloudy",
-    StandardWeatherCondition.OVERCAST: "Overcast",
-    StandardWeatherCondition.FOG: "Fog",
-    StandardWeatherCondition.MIST: "Mist",
-    StandardWeatherCondition.LIGHT_RAIN: "Light Rain",
-    StandardWeatherCondition.MODERATE_RAIN: "Moderate Rain",
-    StandardWeatherCondition.HEAVY_RAIN: "Heavy Rain",
-    StandardWeatherCondition.DRIZZLE: "Drizzle",
-    StandardWeatherCondition.LIGHT_SNOW: "Light Snow",
-    StandardWeatherCondition.MODERATE_SNOW: "Moderate Snow",
-    StandardWeatherCondition.HEAVY_SNOW: "Heavy Snow",
-    StandardWeatherCondition.THUNDERSTORM: "Thunderstorm",
-    StandardWeatherCondition.THUNDERSTORM_WITH_RAIN: "Thunderstorm with Rain",
-    StandardWeatherCondition.THUNDERSTORM_WITH_HAIL: "Thunderstorm with Hail",
-    StandardWeatherCondition.RAIN_SHOWERS: "Rain Showers",
-    StandardWeatherCondition.SNOW_SHOWERS: "Snow Showers",
-    StandardWeatherCondition.SLEET: "Sleet",
-    StandardWeatherCondition.FREEZING_RAIN: "Freezing Rain",
-    StandardWeatherCondition.BLIZZARD: "Blizzard",
-    StandardWeatherCondition.SANDSTORM: "Sandstorm",
-    StandardWeatherCondition.UNKNOWN: "Unknown"
-}
+import sys
+from enum import IntEnum
+from types import MappingProxyType
+from typing import List, Optional, Tuple
+
+class StandardWeatherCondition(IntEnum):
+    """
+    Standardized weather conditions
+    
+    Members are small ints so internal comparisons and tables stay plain ints.
+    Each member also carries its API label (interned for identity-fast comparisons)
+    and a human-readable description, e.g. StandardWeatherCondition.CLEAR.label.
+    """
+    # Per-member attributes set in __new__ (annotations only, so they are not members)
+    label: str
+    description: str
+    
+    CLEAR = (0, "clear", "Clear Sky")
+    PARTLY_CLOUDY = (1, "partly_cloudy", "Partly Cloudy")
+    CLOUDY = (2, "cloudy", "Cloudy")
+    OVERCAST = (3, "overcast", "Overcast")
+    FOG = (4, "fog", "Fog")
+    MIST = (5, "mist", "Mist")
+    LIGHT_RAIN = (6, "light_rain", "Light Rain")
+    MODERATE_RAIN = (7, "moderate_rain", "Moderate Rain")
+    HEAVY_RAIN = (8, "heavy_rain", "Heavy Rain")
+    DRIZZLE = (9, "drizzle", "Drizzle")
+    LIGHT_SNOW = (10, "light_snow", "Light Snow")
+    MODERATE_SNOW = (11, "moderate_snow", "Moderate Snow")
+    HEAVY_SNOW = (12, "heavy_snow", "Heavy Snow")
+    THUNDERSTORM = (13, "thunderstorm", "Thunderstorm")
+    THUNDERSTORM_WITH_RAIN = (14, "thunderstorm_with_rain", "Thunderstorm with Rain")
+    THUNDERSTORM_WITH_HAIL = (15, "thunderstorm_with_hail", "Thunderstorm with Hail")
+    RAIN_SHOWERS = (16, "rain_showers", "Rain Showers")
+    SNOW_SHOWERS = (17, "snow_showers", "Snow Showers")
+    SLEET = (18, "sleet", "Sleet")
+    FREEZING_RAIN = (19, "freezing_rain", "Freezing Rain")
+    BLIZZARD = (20, "blizzard", "Blizzard")
+    SANDSTORM = (21, "sandstorm", "Sandstorm")
+    UNKNOWN = (22, "unknown", "Unknown")
+
+    def __new__(cls, value: int, label: str, description: str):
+        member = int.__new__(cls, value)
+        member._value_ = value
+        member.label = sys.intern(label)
+        member.description = description
+        return member
 
 # WeatherAPI condition codes to Standard Condition mapping
 # Reference: https://www.weatherapi.com/docs/weather_conditions.json
-WEATHERAPI_CODE_MAPPING = {
-    1000: StandardWeatherCondition.CLEAR,                    # Sunny/Clear
-    1003: StandardWeatherCondition.PARTLY_CLOUDY,            # Partly cloudy
-    1006: StandardWeatherCondition.CLOUDY,                   # Cloudy
-    1009: StandardWeatherCondition.OVERCAST,                 # Overcast
-    1030: StandardWeatherCondition.MIST,                     # Mist
-    1063: StandardWeatherCondition.LIGHT_RAIN,               # Patchy rain possible
-    1066: StandardWeatherCondition.LIGHT_SNOW,               # Patchy snow possible
-    1069: StandardWeatherCondition.SLEET,                    # Patchy sleet possible
-    1072: StandardWeatherCondition.FREEZING_RAIN,            # Patchy freezing drizzle possible
-    1087: StandardWeatherCondition.THUNDERSTORM,             # Thundery outbreaks possible
-    1114: StandardWeatherCondition.BLIZZARD,                 # Blowing snow
-    1117: StandardWeatherCondition.BLIZZARD,                 # Blizzard
-    1135: StandardWeatherCondition.FOG,                      # Fog
-    1147: StandardWeatherCondition.FOG,                      # Freezing fog
-    1150: StandardWeatherCondition.DRIZZLE,                  # Patchy light drizzle
-    1153: StandardWeatherCondition.DRIZZLE,                  # Light drizzle
-    1168: StandardWeatherCondition.FREEZING_RAIN,            # Freezing drizzle
-    1171: StandardWeatherCondition.FREEZING_RAIN,            # Heavy freezing drizzle
-    1180: StandardWeatherCondition.LIGHT_RAIN,               # Patchy light rain
-    1183: StandardWeatherCondition.LIGHT_RAIN,               # Light rain
-    1186: StandardWeatherCondition.MODERATE_RAIN,            # Moderate rain at times
-    1189: StandardWeatherCondition.MODERATE_RAIN,            # Moderate rain
-    1192: StandardWeatherCondition.HEAVY_RAIN,               # Heavy rain at times
-    1195: StandardWeatherCondition.HEAVY_RAIN,               # Heavy rain
-    1198: StandardWeatherCondition.FREEZING_RAIN,            # Light freezing rain
-    1201: StandardWeatherCondition.FREEZING_RAIN,            # Moderate or heavy freezing rain
-    1204: StandardWeatherCondition.SLEET,                    # Light sleet
-    1207: StandardWeatherCondition.SLEET,                    # Moderate or heavy sleet
-    1210: StandardWeatherCondition.LIGHT_SNOW,               # Patchy light snow
-    1213: StandardWeatherCondition.LIGHT_SNOW,               # Light snow
-    1216: StandardWeatherCondition.MODERATE_SNOW,            # Patchy moderate snow
-    1219: StandardWeatherCondition.MODERATE_SNOW,            # Moderate snow
-    1222: StandardWeatherCondition.HEAVY_SNOW,               # Patchy heavy snow
-    1225: StandardWeatherCondition.HEAVY_SNOW,               # Heavy snow
-    1237: StandardWeatherCondition.SLEET,                    # Ice pellets
-    1240: StandardWeatherCondition.RAIN_SHOWERS,             # Light rain shower
-    1243: StandardWeatherCondition.RAIN_SHOWERS,             # Moderate or heavy rain shower
-    1246: StandardWeatherCondition.RAIN_SHOWERS,             # Torrential rain shower
-    1249: StandardWeatherCondition.SLEET,                    # Light sleet showers
-    1252: StandardWeatherCondition.SLEET,                    # Moderate or heavy sleet showers
-    1255: StandardWeatherCondition.SNOW_SHOWERS,             # Light snow showers
-    1258: StandardWeatherCondition.SNOW_SHOWERS,             # Moderate or heavy snow showers
-    1261: StandardWeatherCondition.SLEET,                    # Light showers of ice pellets
-    1264: StandardWeatherCondition.SLEET,                    # Moderate or heavy showers of ice pellets
-    1273: StandardWeatherCondition.THUNDERSTORM_WITH_RAIN,   # Patchy light rain with thunder
-    1276: StandardWeatherCondition.THUNDERSTORM_WITH_RAIN,   # Moderate or heavy rain with thunder
-    1279: StandardWeatherCondition.THUNDERSTORM_WITH_RAIN,   # Patchy light snow with thunder
-    1282: StandardWeatherCondition.THUNDERSTORM_WITH_RAIN,   # Moderate or heavy snow with thunder
-}
+_WEATHERAPI_RAW = (
+    (1000, StandardWeatherCondition.CLEAR),                   # Sunny/Clear
+    (1003, StandardWeatherCondition.PARTLY_CLOUDY),           # Partly cloudy
+    (1006, StandardWeatherCondition.CLOUDY),                  # Cloudy
+    (1009, StandardWeatherCondition.OVERCAST),                # Overcast
+    (1030, StandardWeatherCondition.MIST),                    # Mist
+    (1063, StandardWeatherCondition.LIGHT_RAIN),              # Patchy rain possible
+    (1066, StandardWeatherCondition.LIGHT_SNOW),              # Patchy snow possible
+    (1069, StandardWeatherCondition.SLEET),                   # Patchy sleet possible
+    (1072, StandardWeatherCondition.FREEZING_RAIN),           # Patchy freezing drizzle possible
+    (1087, StandardWeatherCondition.THUNDERSTORM),            # Thundery outbreaks possible
+    (1114, StandardWeatherCondition.BLIZZARD),                # Blowing snow
+    (1117, StandardWeatherCondition.BLIZZARD),                # Blizzard
+    (1135, StandardWeatherCondition.FOG),                     # Fog
+    (1147, StandardWeatherCondition.FOG),                     # Freezing fog
+    (1150, StandardWeatherCondition.DRIZZLE),                 # Patchy light drizzle
+    (1153, StandardWeatherCondition.DRIZZLE),                 # Light drizzle
+    (1168, StandardWeatherCondition.FREEZING_RAIN),           # Freezing drizzle
+    (1171, StandardWeatherCondition.FREEZING_RAIN),           # Heavy freezing drizzle
+    (1180, StandardWeatherCondition.LIGHT_RAIN),              # Patchy light rain
+    (1183, StandardWeatherCondition.LIGHT_RAIN),              # Light rain
+    (1186, StandardWeatherCondition.MODERATE_RAIN),           # Moderate rain at times
+    (1189, StandardWeatherCondition.MODERATE_RAIN),           # Moderate rain
+    (1192, StandardWeatherCondition.HEAVY_RAIN),              # Heavy rain at times
+    (1195, StandardWeatherCondition.HEAVY_RAIN),              # Heavy rain
+    (1198, StandardWeatherCondition.FREEZING_RAIN),           # Light freezing rain
+    (1201, StandardWeatherCondition.FREEZING_RAIN),           # Moderate or heavy freezing rain
+    (1204, StandardWeatherCondition.SLEET),                   # Light sleet
+    (1207, StandardWeatherCondition.SLEET),                   # Moderate or heavy sleet
+    (1210, StandardWeatherCondition.LIGHT_SNOW),              # Patchy light snow
+    (1213, StandardWeatherCondition.LIGHT_SNOW),              # Light snow
+    (1216, StandardWeatherCondition.MODERATE_SNOW),           # Patchy moderate snow
+    (1219, StandardWeatherCondition.MODERATE_SNOW),           # Moderate snow
+    (1222, StandardWeatherCondition.HEAVY_SNOW),              # Patchy heavy snow
+    (1225, StandardWeatherCondition.HEAVY_SNOW),              # Heavy snow
+    (1237, StandardWeatherCondition.SLEET),                   # Ice pellets
+    (1240, StandardWeatherCondition.RAIN_SHOWERS),            # Light rain shower
+    (1243, StandardWeatherCondition.RAIN_SHOWERS),            # Moderate or heavy rain shower
+    (1246, StandardWeatherCondition.RAIN_SHOWERS),            # Torrential rain shower
+    (1249, StandardWeatherCondition.SLEET),                   # Light sleet showers
+    (1252, StandardWeatherCondition.SLEET),                   # Moderate or heavy sleet showers
+    (1255, StandardWeatherCondition.SNOW_SHOWERS),            # Light snow showers
+    (1258, StandardWeatherCondition.SNOW_SHOWERS),            # Moderate or heavy snow showers
+    (1261, StandardWeatherCondition.SLEET),                   # Light showers of ice pellets
+    (1264, StandardWeatherCondition.SLEET),                   # Moderate or heavy showers of ice pellets
+    (1273, StandardWeatherCondition.THUNDERSTORM_WITH_RAIN),  # Patchy light rain with thunder
+    (1276, StandardWeatherCondition.THUNDERSTORM_WITH_RAIN),  # Moderate or heavy rain with thunder
+    (1279, StandardWeatherCondition.THUNDERSTORM_WITH_RAIN),  # Patchy light snow with thunder
+    (1282, StandardWeatherCondition.THUNDERSTORM_WITH_RAIN),  # Moderate or heavy snow with thunder
+)
 
 # OpenWeatherMap ID to Standard Condition mapping
 # Reference: https://openweathermap.org/weather-conditions
-OPENWEATHER_CODE_MAPPING = {
+_OPENWEATHER_RAW = (
     # Clear
-    800: StandardWeatherCondition.CLEAR,
+    (800, StandardWeatherCondition.CLEAR),
     
     # Clouds
-    801: StandardWeatherCondition.PARTLY_CLOUDY,  # few clouds
-    802: StandardWeatherCondition.PARTLY_CLOUDY,  # scattered clouds
-    803: StandardWeatherCondition.CLOUDY,         # broken clouds
-    804: StandardWeatherCondition.OVERCAST,       # overcast clouds
+    (801, StandardWeatherCondition.PARTLY_CLOUDY),           # few clouds
+    (802, StandardWeatherCondition.PARTLY_CLOUDY),           # scattered clouds
+    (803, StandardWeatherCondition.CLOUDY),                  # broken clouds
+    (804, StandardWeatherCondition.OVERCAST),                # overcast clouds
     
     # Atmosphere
-    701: StandardWeatherCondition.MIST,           # mist
-    711: StandardWeatherCondition.FOG,            # smoke
-    721: StandardWeatherCondition.FOG,            # haze
-    731: StandardWeatherCondition.SANDSTORM,      # sand/dust whirls
-    741: StandardWeatherCondition.FOG,            # fog
-    751: StandardWeatherCondition.SANDSTORM,      # sand
-    761: StandardWeatherCondition.SANDSTORM,      # dust
-    762: StandardWeatherCondition.SANDSTORM,      # volcanic ash
-    771: StandardWeatherCondition.RAIN_SHOWERS,   # squalls
-    781: StandardWeatherCondition.THUNDERSTORM,   # tornado
+    (701, StandardWeatherCondition.MIST),                    # mist
+    (711, StandardWeatherCondition.FOG),                     # smoke
+    (721, StandardWeatherCondition.FOG),                     # haze
+    (731, StandardWeatherCondition.SANDSTORM),               # sand/dust whirls
+    (741, StandardWeatherCondition.FOG),                     # fog
+    (751, StandardWeatherCondition.SANDSTORM),               # sand
+    (761, StandardWeatherCondition.SANDSTORM),               # dust
+    (762, StandardWeatherCondition.SANDSTORM),               # volcanic ash
+    (771, StandardWeatherCondition.RAIN_SHOWERS),            # squalls
+    (781, StandardWeatherCondition.THUNDERSTORM),            # tornado
     
     # Drizzle
-    300: StandardWeatherCondition.DRIZZLE,        # light intensity drizzle
-    301: StandardWeatherCondition.DRIZZLE,        # drizzle
-    302: StandardWeatherCondition.DRIZZLE,        # heavy intensity drizzle
-    310: StandardWeatherCondition.DRIZZLE,        # light intensity drizzle rain
-    311: StandardWeatherCondition.DRIZZLE,        # drizzle rain
-    312: StandardWeatherCondition.DRIZZLE,        # heavy intensity drizzle rain
-    313: StandardWeatherCondition.RAIN_SHOWERS,   # shower rain and drizzle
-    314: StandardWeatherCondition.RAIN_SHOWERS,   # heavy shower rain and drizzle
-    321: StandardWeatherCondition.RAIN_SHOWERS,   # shower drizzle
+    (300, StandardWeatherCondition.DRIZZLE),                 # light intensity drizzle
+    (301, StandardWeatherCondition.DRIZZLE),                 # drizzle
+    (302, StandardWeatherCondition.DRIZZLE),                 # heavy intensity drizzle
+    (310, StandardWeatherCondition.DRIZZLE),                 # light intensity drizzle rain
+    (311, StandardWeatherCondition.DRIZZLE),                 # drizzle rain
+    (312, StandardWeatherCondition.DRIZZLE),                 # heavy intensity drizzle rain
+    (313, StandardWeatherCondition.RAIN_SHOWERS),            # shower rain and drizzle
+    (314, StandardWeatherCondition.RAIN_SHOWERS),            # heavy shower rain and drizzle
+    (321, StandardWeatherCondition.RAIN_SHOWERS),            # shower drizzle
     
     # Rain
-    500: StandardWeatherCondition.LIGHT_RAIN,     # light rain
-    501: StandardWeatherCondition.MODERATE_RAIN,  # moderate rain
-    502: StandardWeatherCondition.HEAVY_RAIN,     # heavy intensity rain
-    503: StandardWeatherCondition.HEAVY_RAIN,     # very heavy rain
-    504: StandardWeatherCondition.HEAVY_RAIN,     # extreme rain
-    511: StandardWeatherCondition.FREEZING_RAIN,  # freezing rain
-    520: StandardWeatherCondition.RAIN_SHOWERS,   # light intensity shower rain
-    521: StandardWeatherCondition.RAIN_SHOWERS,   # shower rain
-    522: StandardWeatherCondition.RAIN_SHOWERS,   # heavy intensity shower rain
-    531: StandardWeatherCondition.RAIN_SHOWERS,   # ragged shower rain
+    (500, StandardWeatherCondition.LIGHT_RAIN),              # light rain
+    (501, StandardWeatherCondition.MODERATE_RAIN),           # moderate rain
+    (502, StandardWeatherCondition.HEAVY_RAIN),              # heavy intensity rain
+    (503, StandardWeatherCondition.HEAVY_RAIN),              # very heavy rain
+    (504, StandardWeatherCondition.HEAVY_RAIN),              # extreme rain
+    (511, StandardWeatherCondition.FREEZING_RAIN),           # freezing rain
+    (520, StandardWeatherCondition.RAIN_SHOWERS),            # light intensity shower rain
+    (521, StandardWeatherCondition.RAIN_SHOWERS),            # shower rain
+    (522, StandardWeatherCondition.RAIN_SHOWERS),            # heavy intensity shower rain
+    (531, StandardWeatherCondition.RAIN_SHOWERS),            # ragged shower rain
     
     # Snow
-    600: StandardWeatherCondition.LIGHT_SNOW,     # light snow
-    601: StandardWeatherCondition.MODERATE_SNOW,  # snow
-    602: StandardWeatherCondition.HEAVY_SNOW,     # heavy snow
-    611: StandardWeatherCondition.SLEET,          # sleet
-    612: StandardWeatherCondition.SLEET,          # light shower sleet
-    613: StandardWeatherCondition.SLEET,          # shower sleet
-    615: StandardWeatherCondition.LIGHT_SNOW,     # light rain and snow
-    616: StandardWeatherCondition.MODERATE_SNOW,  # rain and snow
-    620: StandardWeatherCondition.SNOW_SHOWERS,   # light shower snow
-    621: StandardWeatherCondition.SNOW_SHOWERS,   # shower snow
-    622: StandardWeatherCondition.BLIZZARD,       # heavy shower snow
+    (600, StandardWeatherCondition.LIGHT_SNOW),              # light snow
+    (601, StandardWeatherCondition.MODERATE_SNOW),           # snow
+    (602, StandardWeatherCondition.HEAVY_SNOW),              # heavy snow
+    (611, StandardWeatherCondition.SLEET),                   # sleet
+    (612, StandardWeatherCondition.SLEET),                   # light shower sleet
+    (613, StandardWeatherCondition.SLEET),                   # shower sleet
+    (615, StandardWeatherCondition.LIGHT_SNOW),              # light rain and snow
+    (616, StandardWeatherCondition.MODERATE_SNOW),           # rain and snow
+    (620, StandardWeatherCondition.SNOW_SHOWERS),            # light shower snow
+    (621, StandardWeatherCondition.SNOW_SHOWERS),            # shower snow
+    (622, StandardWeatherCondition.BLIZZARD),                # heavy shower snow
     
     # Thunderstorm
-    200: StandardWeatherCondition.THUNDERSTORM_WITH_RAIN,  # thunderstorm with light rain
-    201: StandardWeatherCondition.THUNDERSTORM_WITH_RAIN,  # thunderstorm with rain
-    202: StandardWeatherCondition.THUNDERSTORM_WITH_RAIN,  # thunderstorm with heavy rain
-    210: StandardWeatherCondition.THUNDERSTORM,            # light thunderstorm
-    211: StandardWeatherCondition.THUNDERSTORM,            # thunderstorm
-    212: StandardWeatherCondition.THUNDERSTORM,            # heavy thunderstorm
-    221: StandardWeatherCondition.THUNDERSTORM,            # ragged thunderstorm
-    230: StandardWeatherCondition.THUNDERSTORM_WITH_RAIN,  # thunderstorm with light drizzle
-    231: StandardWeatherCondition.THUNDERSTORM_WITH_RAIN,  # thunderstorm with drizzle
-    232: StandardWeatherCondition.THUNDERSTORM_WITH_RAIN,  # thunderstorm with heavy drizzle
-}
+    (200, StandardWeatherCondition.THUNDERSTORM_WITH_RAIN),  # thunderstorm with light rain
+    (201, StandardWeatherCondition.THUNDERSTORM_WITH_RAIN),  # thunderstorm with rain
+    (202, StandardWeatherCondition.THUNDERSTORM_WITH_RAIN),  # thunderstorm with heavy rain
+    (210, StandardWeatherCondition.THUNDERSTORM),            # light thunderstorm
+    (211, StandardWeatherCondition.THUNDERSTORM),            # thunderstorm
+    (212, StandardWeatherCondition.THUNDERSTORM),            # heavy thunderstorm
+    (221, StandardWeatherCondition.THUNDERSTORM),            # ragged thunderstorm
+    (230, StandardWeatherCondition.THUNDERSTORM_WITH_RAIN),  # thunderstorm with light drizzle
+    (231, StandardWeatherCondition.THUNDERSTORM_WITH_RAIN),  # thunderstorm with drizzle
+    (232, StandardWeatherCondition.THUNDERSTORM_WITH_RAIN),  # thunderstorm with heavy drizzle
+)
 
 # Open-Meteo WMO codes to Standard Condition mapping
 # Reference: https://open-meteo.com/en/docs
-OPENMETEO_CODE_MAPPING = {
-    0: StandardWeatherCondition.CLEAR,                    # Clear sky
-    1: StandardWeatherCondition.PARTLY_CLOUDY,            # Mainly clear
-    2: StandardWeatherCondition.PARTLY_CLOUDY,            # Partly cloudy
-    3: StandardWeatherCondition.OVERCAST,                 # Overcast
-    45: StandardWeatherCondition.FOG,                     # Fog
-    48: StandardWeatherCondition.FOG,                     # Depositing rime fog
-    51: StandardWeatherCondition.DRIZZLE,                 # Light drizzle
-    53: StandardWeatherCondition.DRIZZLE,                 # Moderate drizzle
-    55: StandardWeatherCondition.DRIZZLE,                 # Dense drizzle
-    56: StandardWeatherCondition.FREEZING_RAIN,           # Light freezing drizzle
-    57: StandardWeatherCondition.FREEZING_RAIN,           # Dense freezing drizzle
-    61: StandardWeatherCondition.LIGHT_RAIN,              # Slight rain
-    63: StandardWeatherCondition.MODERATE_RAIN,           # Moderate rain
-    65: StandardWeatherCondition.HEAVY_RAIN,              # Heavy rain
-    66: StandardWeatherCondition.FREEZING_RAIN,           # Light freezing rain
-    67: StandardWeatherCondition.FREEZING_RAIN,           # Heavy freezing rain
-    71: StandardWeatherCondition.LIGHT_SNOW,              # Slight snow fall
-    73: StandardWeatherCondition.MODERATE_SNOW,           # Moderate snow fall
-    75: StandardWeatherCondition.HEAVY_SNOW,              # Heavy snow fall
-    77: StandardWeatherCondition.LIGHT_SNOW,              # Snow grains
-    80: StandardWeatherCondition.RAIN_SHOWERS,            # Slight rain showers
-    81: StandardWeatherCondition.RAIN_SHOWERS,            # Moderate rain showers
-    82: StandardWeatherCondition.RAIN_SHOWERS,            # Violent rain showers
-    85: StandardWeatherCondition.SNOW_SHOWERS,            # Slight snow showers
-    86: StandardWeatherCondition.SNOW_SHOWERS,            # Heavy snow showers
-    95: StandardWeatherCondition.THUNDERSTORM,            # Thunderstorm
-    96: StandardWeatherCondition.THUNDERSTORM_WITH_HAIL,  # Thunderstorm with slight hail
-    99: StandardWeatherCondition.THUNDERSTORM_WITH_HAIL,  # Thunderstorm with heavy hail
-}
\ No newline at end of file
+_OPENMETEO_RAW = (
+    (0, StandardWeatherCondition.CLEAR),                    # Clear sky
+    (1, StandardWeatherCondition.PARTLY_CLOUDY),            # Mainly clear
+    (2, StandardWeatherCondition.PARTLY_CLOUDY),            # Partly cloudy
+    (3, StandardWeatherCondition.OVERCAST),                 # Overcast
+    (45, StandardWeatherCondition.FOG),                     # Fog
+    (48, StandardWeatherCondition.FOG),                     # Depositing rime fog
+    (51, StandardWeatherCondition.DRIZZLE),                 # Light drizzle
+    (53, StandardWeatherCondition.DRIZZLE),                 # Moderate drizzle
+    (55, StandardWeatherCondition.DRIZZLE),                 # Dense drizzle
+    (56, StandardWeatherCondition.FREEZING_RAIN),           # Light freezing drizzle
+    (57, StandardWeatherCondition.FREEZING_RAIN),           # Dense freezing drizzle
+    (61, StandardWeatherCondition.LIGHT_RAIN),              # Slight rain
+    (63, StandardWeatherCondition.MODERATE_RAIN),           # Moderate rain
+    (65, StandardWeatherCondition.HEAVY_RAIN),              # Heavy rain
+    (66, StandardWeatherCondition.FREEZING_RAIN),           # Light freezing rain
+    (67, StandardWeatherCondition.FREEZING_RAIN),           # Heavy freezing rain
+    (71, StandardWeatherCondition.LIGHT_SNOW),              # Slight snow fall
+    (73, StandardWeatherCondition.MODERATE_SNOW),           # Moderate snow fall
+    (75, StandardWeatherCondition.HEAVY_SNOW),              # Heavy snow fall
+    (77, StandardWeatherCondition.LIGHT_SNOW),              # Snow grains
+    (80, StandardWeatherCondition.RAIN_SHOWERS),            # Slight rain showers
+    (81, StandardWeatherCondition.RAIN_SHOWERS),            # Moderate rain showers
+    (82, StandardWeatherCondition.RAIN_SHOWERS),            # Violent rain showers
+    (85, StandardWeatherCondition.SNOW_SHOWERS),            # Slight snow showers
+    (86, StandardWeatherCondition.SNOW_SHOWERS),            # Heavy snow showers
+    (95, StandardWeatherCondition.THUNDERSTORM),            # Thunderstorm
+    (96, StandardWeatherCondition.THUNDERSTORM_WITH_HAIL),  # Thunderstorm with slight hail
+    (99, StandardWeatherCondition.THUNDERSTORM_WITH_HAIL),  # Thunderstorm with heavy hail
+)
+
+# API label for each condition, indexed by the condition's int value, so every
+# table slot holding the same condition shares one string object
+_LABELS = tuple(condition.label for condition in StandardWeatherCondition)
+
+# Reverse lookup: API label -> condition, built once and read-only.
+# Keys are the interned labels, so lookups with those strings short-circuit on identity.
+_BY_LABEL = MappingProxyType({condition.label: condition for condition in StandardWeatherCondition})
+
+
+def condition_from_label(label: str) -> Optional[StandardWeatherCondition]:
+    """
+    Parse a standard condition label (e.g. "clear") back to its enum member
+    
+    Args:
+        label: str
+
+    Returns:
+        Optional[StandardWeatherCondition] -> None for unknown labels
+    """
+    return _BY_LABEL.get(label)
+
+# Provider ids index the combined code table below
+OPENWEATHER_ID = 0
+WEATHERAPI_ID = 1
+OPENMETEO_ID = 2
+
+# Provider config key -> provider id, resolved once when a provider is constructed
+PROVIDER_IDS = {
+    "openweather": OPENWEATHER_ID,
+    "weatherapi": WEATHERAPI_ID,
+    "openmeteo": OPENMETEO_ID
+}
+
+
+def _build_code_table(*providers: Tuple[Tuple[int, StandardWeatherCondition], ...]) -> Tuple[Tuple[Tuple[int, int, int], ...], Tuple[Optional[str], ...]]:
+    """
+    Lay all provider (code, condition) pairs out in one flat tuple
+    
+    Each provider owns a contiguous block covering its lowest to highest code,
+    so (provider_id, code) resolves to a unique slot with no hashing or collisions.
+    The slot list is allocated once at its final size and built straight from the
+    raw pairs, which are the single source of truth for every provider code.
+    Returns the per-provider (base code, block start, block size) layout and the slots.
+    """
+    layout = []
+    start = 0
+    for pairs in providers:
+        codes = [code for code, _ in pairs]
+        base = min(codes)
+        size = max(codes) - base + 1
+        layout.append((base, start, size))
+        start += size
+    
+    slots: List[Optional[str]] = [None] * start
+    for (base, block_start, _), pairs in zip(layout, providers):
+        for code, condition in pairs:
+            slots[block_start + code - base] = _LABELS[condition]
+    return tuple(layout), tuple(slots)
+
+
+# Block sizes: OpenWeatherMap 605 (200-804), WeatherAPI 283 (1000-1282), Open-Meteo 100 (0-99)
+_CODE_LAYOUT, _CODE_SLOTS = _build_code_table(
+    _OPENWEATHER_RAW,
+    _WEATHERAPI_RAW,
+    _OPENMETEO_RAW
+)
+
+
+def standardize_code(provider_id: int, code: int) -> Optional[str]:
+    """
+    Map a provider-specific weather code to its standard condition string
+    
+    Args:
+        provider_id: int -> OPENWEATHER_ID, WEATHERAPI_ID or OPENMETEO_ID
+        code: int
+
+    Returns:
+        Optional[str] -> standard condition string, None for unknown or non-int codes
+        
+    Note:
+        - A bounds check plus one tuple index into the precomputed table; nothing is memoized
+    """
+    base, start, size = _CODE_LAYOUT[provider_id]
+    index = code - base if type(code) is int else -1
+    if 0 <= index < size:
+        return _CODE_SLOTS[start + index]
+    return None
@@ -1,11 +1,21 @@
 #!/usr/bin/env python3
 """
-Simple health check script for Docker containers using requests.
+Simple health check script for Docker containers using the standard library.
 This script makes an HTTP request to the health endpoint.
+
+http.client keeps the probe cheap: Docker runs it every interval, and importing
+requests (urllib3, charset detection, certifi) cost more than the request itself.
 """
 
 import sys
-import requests
+from http.client import HTTPConnection, HTTPSConnection
+from urllib.parse import urlsplit
+
+# orjson parses the raw response bytes directly; the stdlib json module is the fallback
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 def health_check(url: str = "http://localhost:8000/health", timeout: int = 10) -> bool:
     """
@@ -19,18 +29,40 @@ def health_check(url: str = "http://localhost:8000/health", timeout: int = 10) -
         True if healthy, False otherwise
     """
     try:
-        # Make the request with requests library
-        response = requests.get(
-            url, 
-            timeout=timeout,
-            headers={'User-Agent': 'Docker-HealthCheck/1.0'}
-        )
+        # Make the request with the stdlib HTTP client matching the URL scheme
+        parts = urlsplit(url)
+        if not parts.hostname:
+            print(f"Health check failed: No host in URL '{url}'", file=sys.stderr)
+            return False
+        
+        connection: HTTPConnection
+        if parts.scheme == "https":
+            connection = HTTPSConnection(parts.hostname, parts.port or 443, timeout=timeout)
+        elif parts.scheme == "http":
+            connection = HTTPConnection(parts.hostname, parts.port or 80, timeout=timeout)
+        else:
+            print(f"Health check failed: Unsupported URL scheme '{parts.scheme}'", file=sys.stderr)
+            return False
+        
+        # Keep any query string from the health URL
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        
+        try:
+            connection.request("GET", target, headers={'User-Agent': 'Docker-HealthCheck/1.0'})
+            response = connection.getresponse()
+            body = response.read()
+        finally:
+            connection.close()
         
         # Check status code
-        response.raise_for_status()  # Raises an exception for 4xx/5xx status codes
+        if response.status >= 400:
+            print(f"Health check failed: HTTP {response.status}", file=sys.stderr)
+            return False
         
         # Parse JSON response
-        data = response.json()
+        data = json_loads(body)
         status = data.get('status', '').lower()
         
         if status == 'healthy':
@@ -2,53 +2,128 @@
 Global test configuration and fixtures
 """
 import pytest
+import pytest_asyncio
 import asyncio
-import os
-from unittest.mock import Mock, AsyncMock, patch
-from typing import Dict, Any, Generator
 import aiohttp
+from httpx import AsyncClient, ASGITransport
+from unittest.mock import Mock, patch
+from typing import Dict, Any, Generator
 
-# Set test environment variables
-os.environ.update({
+# Test environment variables
+TEST_ENV = {
     'OPENWEATHER_API_KEY': 'test_openweather_key',
     'WEATHERAPI_KEY': 'test_weatherapi_key',
     'API_KEYS': 'test_api_key_1,test_api_key_2',
     'LOG_LEVEL': 'DEBUG',
     'CACHE_TTL': '60'
-})
+}
+
+_env_patch = None
+
+def pytest_configure(config):
+    """
+    Set the test environment once per session, before collection.
+    
+    app.config reads the environment when it is first imported, which happens
+    while test modules are collected, so this cannot be a fixture. A MonkeyPatch
+    keeps the change reversible and is undone in pytest_unconfigure.
+    """
+    global _env_patch
+    if _env_patch is not None:
+        return
+    _env_patch = pytest.MonkeyPatch()
+    for key, value in TEST_ENV.items():
+        _env_patch.setenv(key, value)
+
+def pytest_unconfigure(config):
+    """Restore the original environment at the end of the session"""
+    global _env_patch
+    if _env_patch is not None:
+        _env_patch.undo()
+        _env_patch = None
 
 @pytest.fixture(scope="session")
 def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    """Create an event loop for the test session."""
+    loop = asyncio.new_event_loop()
+    # Tests never need slow-callback warnings; a high threshold keeps debug mode quiet
+    loop.slow_callback_duration = 10.0
+    asyncio.set_event_loop(loop)
     yield loop
+    asyncio.set_event_loop(None)
     loop.close()
 
-@pytest.fixture
-def mock_http_session():
-    """Mock HTTP session for testing"""
-    session = AsyncMock(spec=aiohttp.ClientSession)
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """
+    In-process HTTP client for the FastAPI app; requests never touch a socket.
     
-    # Create a mock response
-    mock_response = AsyncMock()
-    mock_response.status = 200
-    mock_response.json = AsyncMock(return_value={"test": "data"})
-    mock_response.headers = {}
+    The lifespan is not run, so no upstream session is opened. Use it for
+    tests that do not depend on real weather providers or real latency.
+    """
+    # Imported here, not at module level, so app.config reads TEST_ENV (set in pytest_configure)
+    from app.core.main import app
     
-    # Create a mock context manager for session.get()
-    mock_context = AsyncMock()
-    mock_context.__aenter__ = AsyncMock(return_value=mock_response)
-    mock_context.__aexit__ = AsyncMock(return_value=None)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+@pytest_asyncio.fixture(scope="session")
+async def session():
+    """
+    Live aiohttp session shared by every functional test in the run.
     
-    # Mock the get method to return the context manager
-    session.get = Mock(return_value=mock_context)
-    session.close = AsyncMock()
+    One pinned keep-alive pool serves all test classes, so connections to the
+    running server are reused instead of re-established per class.
+    """
+    connector = aiohttp.TCPConnector(limit=50, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=75)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        yield session
+
+class _FakeResponse:
+    """Minimal stand-in for aiohttp.ClientResponse"""
+    status = 200
+    headers = {}
+    
+    async def json(self):
+        return {"test": "data"}
     
-    return session
+    async def read(self):
+        return b'{"test": "data"}'
 
-@pytest.fixture
+
+class _FakeRequestContext:
+    """Async context manager returned by FakeSession.get()"""
+    
+    async def __aenter__(self):
+        return _FAKE_RESPONSE
+    
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+class FakeSession:
+    """Hand-rolled aiohttp.ClientSession double; much cheaper to build than AsyncMock"""
+    closed = False
+    
+    def get(self, *args, **kwargs):
+        return _FAKE_REQUEST_CONTEXT
+    
+    async def close(self):
+        self.closed = True
+
+
+# Stateless, so one instance of each is shared across all tests
+_FAKE_RESPONSE = _FakeResponse()
+_FAKE_REQUEST_CONTEXT = _FakeRequestContext()
+
+@pytest.fixture(scope="session")
+def mock_http_session():
+    """Fake HTTP session for testing (stateless, so one instance serves the whole run)"""
+    return FakeSession()
+
+@pytest.fixture(scope="session")
 def sample_weather_data():
-    """Sample weather data for testing"""
+    """Sample weather data for testing (shared by the whole run; tests must not mutate it)"""
     return {
         "openweather": {
             "name": "Singapore",
@@ -122,14 +197,36 @@ def mock_geocoding_response():
         "data": [{"lat": 1.3521, "lon": 103.8198, "name": "Singapore"}]
     }
 
+class _FakeCache:
+    """Dict-backed stand-in for WeatherCache (no TTL, no eviction)"""
+    
+    def __init__(self):
+        self._data = {}
+    
+    def get(self, location):
+        return self._data.get(location)
+    
+    def set(self, location, data, **kwargs):
+        self._data[location] = data
+    
+    def clear(self):
+        self._data.clear()
+    
+    def get_stats(self):
+        return {"size": len(self._data), "hits": 0, "misses": 0}
+
 @pytest.fixture(autouse=True)
-def mock_cache():
-    """Mock cache for all tests"""
-    with patch('app.core.cache.weather_cache') as mock_cache:
-        mock_cache.get.return_value = None
-        mock_cache.set.return_value = None
-        mock_cache.clear.return_value = None
-        yield mock_cache
+def mock_cache(monkeypatch):
+    """Fresh in-memory cache for every test"""
+    # Imported here, not at module level, so app.config reads TEST_ENV (set in pytest_configure)
+    import app.core.cache
+    import app.core.service
+    
+    cache = _FakeCache()
+    # service.py binds the name at import, so replace it there as well
+    monkeypatch.setattr(app.core.cache, "weather_cache", cache)
+    monkeypatch.setattr(app.core.service, "weather_cache", cache)
+    yield cache
 
 @pytest.fixture(autouse=True)
 def mock_logger():
@@ -8,19 +8,22 @@ import os
 # Add app to path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+# Import once at collection; a failure is reported by test_basic_import
+try:
+    from app.config import OPENWEATHER_API_KEY
+    _CONFIG_IMPORT_ERROR = None
+except ImportError as e:
+    _CONFIG_IMPORT_ERROR = e
+
 def test_basic_import():
     """Test that we can import basic modules"""
-    try:
-        from app.config import OPENWEATHER_API_KEY
-        assert True
-    except ImportError as e:
-        pytest.fail(f"Failed to import app.config: {e}")
+    if _CONFIG_IMPORT_ERROR is not None:
+        pytest.fail(f"Failed to import app.config: {_CONFIG_IMPORT_ERROR}")
 
 def test_pytest_working():
     """Test that pytest is working"""
     assert 1 + 1 == 2
 
-@pytest.mark.asyncio
 async def test_async_working():
     """Test that async tests work"""
     import asyncio
@@ -2,14 +2,18 @@
 Functional/Integration Tests for Weather API
 
 These tests actually call the API endpoints and test the complete functionality.
+Tests that depend on real weather providers or real latency use a live server
+at BASE_URL through the shared `session` fixture; the rest dispatch in-process
+through the `client` fixture.
 """
 
 import pytest
 import pytest_asyncio
 import asyncio
 import aiohttp
+import orjson
 import time
-from typing import Dict, Any
+from typing import Any, Dict, Tuple
 
 # Test configuration
 BASE_URL = "http://localhost:8000"
@@ -18,167 +22,172 @@ API_KEYS = {
     "admin": "abc"
 }
 
+# Request constants shared by every test (neither client mutates headers/params)
+NORMAL_HEADERS = {"Authorization": f"Bearer {API_KEYS['normal']}"}
+ADMIN_HEADERS = {"Authorization": f"Bearer {API_KEYS['admin']}"}
+SINGAPORE_PARAMS = {"location": "Singapore"}
+WEATHER_PATH = "/api/v1/weather"
+CONFIG_PATH = "/api/v1/config"
+CACHE_PATH = "/api/v1/cache"
+WEATHER_URL = f"{BASE_URL}{WEATHER_PATH}"
+BATCH_URL = f"{WEATHER_URL}/batch"
+CACHE_URL = f"{BASE_URL}{CACHE_PATH}"
+
+async def fetch_status(session: aiohttp.ClientSession, method: str, url: str, **kwargs) -> int:
+    """Make a request where only the status matters; the body is never read or parsed"""
+    async with session.request(method, url, **kwargs) as response:
+        return response.status
+
+async def fetch_json(session: aiohttp.ClientSession, method: str, url: str, **kwargs) -> Tuple[int, Any]:
+    """Make a request and return (status, parsed JSON body); the body is read before the connection is released"""
+    async with session.request(method, url, **kwargs) as response:
+        return response.status, await response.json(loads=orjson.loads)
+
+@pytest_asyncio.fixture(scope="session")
+async def singapore_weather(session):
+    """Fetch Singapore weather once; shape-only tests share the (status, body)"""
+    return await fetch_json(session, "GET", WEATHER_URL, headers=NORMAL_HEADERS, params=SINGAPORE_PARAMS)
+
 class TestWeatherAPIFunctional:
     """Functional tests"""
     
-    @pytest_asyncio.fixture
-    async def session(self):
-        """Create HTTP session for testing"""
-        async with aiohttp.ClientSession() as session:
-            yield session
-    @pytest.mark.asyncio
-    async def test_weather_endpoint_with_city(self, session):
+    async def test_weather_endpoint_with_city(self, singapore_weather):
         """Test weather endpoint with city name"""
-        headers = {"Authorization": f"Bearer {API_KEYS['normal']}"}
-        params = {"location": "Singapore"}
+        status, data = singapore_weather
+        assert status == 200
         
-        async with session.get(f"{BASE_URL}/api/v1/weather", headers=headers, params=params) as response:
-            assert response.status == 200
-            data = await response.json()
-            
-            # Verify response structure
-            assert "location" in data
-            assert "temperature" in data
-            assert "humidity" in data
-            assert "conditions" in data
-            assert "sources" in data
-            assert "timestamp" in data
-            
-            # Verify temperature structure
-            assert "value" in data["temperature"]
-            assert "unit" in data["temperature"]
-            assert "method" in data["temperature"]
-            assert data["temperature"]["unit"] == "celsius"
-            assert data["temperature"]["method"] == "median"
-            
-            # Verify source information
-            assert isinstance(data["sources"], list)
-            assert len(data["sources"]) > 0
-            
-            # Verify each source has required fields
-            for source in data["sources"]:
-                assert "provider" in source
-                assert "status" in source
-                assert "response_time_ms" in source
-    @pytest.mark.asyncio
+        # Verify response structure
+        assert "location" in data
+        assert "temperature" in data
+        assert "humidity" in data
+        assert "conditions" in data
+        assert "sources" in data
+        assert "timestamp" in data
+        
+        # Verify temperature structure
+        assert "value" in data["temperature"]
+        assert "unit" in data["temperature"]
+        assert "method" in data["temperature"]
+        assert data["temperature"]["unit"] == "celsius"
+        assert data["temperature"]["method"] == "median"
+        
+        # Verify source information
+        assert isinstance(data["sources"], list)
+        assert len(data["sources"]) > 0
+        
+        # Verify each source has required fields
+        for source in data["sources"]:
+            assert "provider" in source
+            assert "status" in source
+            assert "response_time_ms" in source
+    
     async def test_weather_endpoint_with_coordinates(self, session):
         """Test weather endpoint with coordinates"""
-        headers = {"Authorization": f"Bearer {API_KEYS['normal']}"}
         params = {"location": "1.29,103.85"}  # Singapore coordinates
         
-        async with session.get(f"{BASE_URL}/api/v1/weather", headers=headers, params=params) as response:
+        async with session.get(WEATHER_URL, headers=NORMAL_HEADERS, params=params) as response:
             assert response.status == 200
-            data = await response.json()
+            data = await response.json(loads=orjson.loads)
             
             # Should work with coordinates too
             assert "location" in data
             assert "temperature" in data
-    @pytest.mark.asyncio
-    async def test_weather_endpoint_authentication_required(self, session):
+    async def test_weather_endpoint_authentication_required(self, client):
         """Test that authentication is required"""
-        params = {"location": "Singapore"}
-        
         # Test without authentication
-        async with session.get(f"{BASE_URL}/api/v1/weather", params=params) as response:
-            assert response.status == 401 or response.status == 403
+        response = await client.get(WEATHER_PATH, params=SINGAPORE_PARAMS)
+        assert response.status_code == 401 or response.status_code == 403
         
         # Test with invalid authentication
         headers = {"Authorization": "Bearer invalid"}
-        async with session.get(f"{BASE_URL}/api/v1/weather", headers=headers, params=params) as response:
-            assert response.status == 401 or response.status == 403
+        response = await client.get(WEATHER_PATH, headers=headers, params=SINGAPORE_PARAMS)
+        assert response.status_code == 401 or response.status_code == 403
 
-    @pytest.mark.asyncio
     async def test_weather_endpoint_invalid_location(self, session):
         """Test weather endpoint with invalid location"""
-        headers = {"Authorization": f"Bearer {API_KEYS['normal']}"}
         params = {"location": "InvalidCity12345"}
         
-        async with session.get(f"{BASE_URL}/api/v1/weather", headers=headers, params=params) as response:
-            # Should either return error or empty results
-            assert response.status in [200, 400, 404, 500]
+        status = await fetch_status(session, "GET", WEATHER_URL, headers=NORMAL_HEADERS, params=params)
+        # Should either return error or empty results
+        assert status in [200, 400, 404, 500]
     
-    @pytest.mark.asyncio
-    async def test_config_endpoint_admin_access(self, session):
+    async def test_config_endpoint_admin_access(self, client):
         """Test config endpoint requires admin access"""
-        headers = {"Authorization": f"Bearer {API_KEYS['admin']}"}
+        response = await client.get(CONFIG_PATH, headers=ADMIN_HEADERS)
+        assert response.status_code == 200
+        data = orjson.loads(response.content)
         
-        async with session.get(f"{BASE_URL}/api/v1/config", headers=headers) as response:
-            assert response.status == 200
-            data = await response.json()
-            
-            # Verify config structure
-            assert "retry_config" in data
-            assert "rate_limits" in data
-            assert "timeouts" in data
-            assert "cache_ttl_seconds" in data
-            assert "log_level" in data
-            assert "api_keys_configured" in data
+        # Verify config structure
+        assert "retry_config" in data
+        assert "rate_limits" in data
+        assert "timeouts" in data
+        assert "cache_ttl_seconds" in data
+        assert "log_level" in data
+        assert "api_keys_configured" in data
     
-    @pytest.mark.asyncio
-    async def test_config_endpoint_normal_user_denied(self, session):
+    async def test_config_endpoint_normal_user_denied(self, client):
         """Test config endpoint denies normal users"""
-        headers = {"Authorization": f"Bearer {API_KEYS['normal']}"}
-        
-        async with session.get(f"{BASE_URL}/api/v1/config", headers=headers) as response:
-            assert response.status == 403
+        response = await client.get(CONFIG_PATH, headers=NORMAL_HEADERS)
+        assert response.status_code == 403
     
-    @pytest.mark.asyncio
-    async def test_cache_clear_endpoint_admin_access(self, session):
+    async def test_cache_clear_endpoint_admin_access(self, client):
         """Test cache clear endpoint requires admin access"""
-        headers = {"Authorization": f"Bearer {API_KEYS['admin']}"}
+        response = await client.delete(CACHE_PATH, headers=ADMIN_HEADERS)
+        assert response.status_code == 200
+        data = orjson.loads(response.content)
         
-        async with session.delete(f"{BASE_URL}/api/v1/cache", headers=headers) as response:
-            assert response.status == 200
-            data = await response.json()
-            
-            # Verify response structure
-            assert "message" in data
-            assert "timestamp" in data
-            assert "operation" in data
-            assert data["operation"] == "cache_clear"
+        # Verify response structure
+        assert "message" in data
+        assert "timestamp" in data
+        assert "operation" in data
+        assert data["operation"] == "cache_clear"
     
-    @pytest.mark.asyncio
-    async def test_cache_clear_endpoint_normal_user_denied(self, session):
+    async def test_cache_clear_endpoint_normal_user_denied(self, client):
         """Test cache clear endpoint denies normal users"""
-        headers = {"Authorization": f"Bearer {API_KEYS['normal']}"}
-        
-        async with session.delete(f"{BASE_URL}/api/v1/cache", headers=headers) as response:
-            assert response.status == 403
+        response = await client.delete(CACHE_PATH, headers=NORMAL_HEADERS)
+        assert response.status_code == 403
     
-    @pytest.mark.asyncio
     async def test_concurrent_requests(self, session):
         """Test multiple concurrent requests work properly"""
-        headers = {"Authorization": f"Bearer {API_KEYS['normal']}"}
         locations = ["Singapore", "New York", "London", "Tokyo", "Paris"]
         
-        # Create tasks for concurrent requests
-        tasks = []
-        for i, location in enumerate(locations):
-            params = {"location": location}
-            task = session.get(f"{BASE_URL}/api/v1/weather", headers=headers, params=params)
-            tasks.append(task)
-        
-        # Execute all requests concurrently
-        responses = await asyncio.gather(*tasks)
+        # Each request reads its own body inside `async with`, so parsing overlaps the other requests
+        # and every connection goes back to the pool. return_exceptions lets all of them finish
+        # before asserting, so a failure never leaves requests running unobserved.
+        results = await asyncio.gather(
+            *(fetch_json(session, "GET", WEATHER_URL, headers=NORMAL_HEADERS, params={"location": location})
+              for location in locations),
+            return_exceptions=True
+        )
         
-        # Verify all requests succeeded
-        for i, response in enumerate(responses):
-            assert response.status == 200, f"Request {i} failed with status {response.status}"
-            
-            data = await response.json()
+        for location, result in zip(locations, results):
+            if isinstance(result, BaseException):
+                raise result
+            status, data = result
+            assert status == 200, f"Request for {location} failed with status {status}"
             assert "location" in data
             assert "temperature" in data
     
-    @pytest.mark.asyncio
+    async def test_batch_endpoint(self, session):
+        """Test several locations fetched through one batch request"""
+        locations = ["Singapore", "New York", "London", "Tokyo", "Paris"]
+        
+        async with session.post(BATCH_URL, headers=NORMAL_HEADERS,
+                                json={"locations": locations}) as response:
+            assert response.status == 200
+            data = await response.json(loads=orjson.loads)
+        
+        assert data["count"] == len(locations)
+        assert [result["location"] for result in data["results"]] == locations
+        for result in data["results"]:
+            assert result["status"] == "success", f"{result['location']} failed: {result.get('detail')}"
+            assert "temperature" in result["data"]
+    
     async def test_response_time_reasonable(self, session):
         """Test that response times are reasonable"""
-        headers = {"Authorization": f"Bearer {API_KEYS['normal']}"}
-        params = {"location": "Singapore"}
-        
-        start_time = time.time()
-        async with session.get(f"{BASE_URL}/api/v1/weather", headers=headers, params=params) as response:
-            end_time = time.time()
-            response_time = end_time - start_time
+        start_ns = time.perf_counter_ns()
+        async with session.get(WEATHER_URL, headers=NORMAL_HEADERS, params=SINGAPORE_PARAMS) as response:
+            response_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             assert response.status == 200
             assert response_time < 10.0, f"Response time {response_time:.2f}s is too slow"
@@ -186,44 +195,37 @@ class TestWeatherAPIFunctional:
             # Response should be reasonably fast (under 10 seconds)
             print(f"Response time: {response_time:.2f}s")
     
-    @pytest.mark.asyncio
-    async def test_api_documentation_accessible(self, session):
+    async def test_api_documentation_accessible(self, client):
         """Test that API documentation is accessible"""
+        # The three documents are independent, so fetch them concurrently
+        docs, redoc, schema = await asyncio.gather(
+            client.get("/docs"),
+            client.get("/redoc"),
+            client.get("/openapi.json"),
+        )
+        
         # Test OpenAPI docs
-        async with session.get(f"{BASE_URL}/docs") as response:
-            assert response.status == 200
+        assert docs.status_code == 200
         
         # Test ReDoc
-        async with session.get(f"{BASE_URL}/redoc") as response:
-            assert response.status == 200
+        assert redoc.status_code == 200
         
         # Test OpenAPI JSON
-        async with session.get(f"{BASE_URL}/openapi.json") as response:
-            assert response.status == 200
-            data = await response.json()
-            assert "openapi" in data
-            assert "info" in data
+        assert schema.status_code == 200
+        data = orjson.loads(schema.content)
+        assert "openapi" in data
+        assert "info" in data
 
 # Integration test class for more complex scenarios
 class TestWeatherAPIIntegration:
     """Integration tests for complete workflows"""
     
-    @pytest_asyncio.fixture
-    async def session(self):
-        """Create HTTP session for testing"""
-        async with aiohttp.ClientSession() as session:
-            yield session
-    
-    @pytest.mark.asyncio
     async def test_complete_weather_workflow(self, session):
         """Test complete weather data workflow"""
-        headers = {"Authorization": f"Bearer {API_KEYS['normal']}"}
-        
         # Step 1: Get weather for Singapore
-        params = {"location": "Singapore"}
-        async with session.get(f"{BASE_URL}/api/v1/weather", headers=headers, params=params) as response:
+        async with session.get(WEATHER_URL, headers=NORMAL_HEADERS, params=SINGAPORE_PARAMS) as response:
             assert response.status == 200
-            data = await response.json()
+            data = await response.json(loads=orjson.loads)
             
             # Verify we got weather data
             assert data["location"] == "Singapore"
@@ -234,59 +236,57 @@ class TestWeatherAPIIntegration:
             first_response = data
         
         # Step 2: Get same location again (should be cached)
-        async with session.get(f"{BASE_URL}/api/v1/weather", headers=headers, params=params) as response:
+        async with session.get(WEATHER_URL, headers=NORMAL_HEADERS, params=SINGAPORE_PARAMS) as response:
             assert response.status == 200
-            cached_data = await response.json()
+            cached_data = await response.json(loads=orjson.loads)
             
             # Should be same data (cached)
             assert cached_data["location"] == first_response["location"]
             assert cached_data["temperature"]["value"] == first_response["temperature"]["value"]
         
         # Step 3: Clear cache (admin only)
-        admin_headers = {"Authorization": f"Bearer {API_KEYS['admin']}"}
-        async with session.delete(f"{BASE_URL}/api/v1/cache", headers=admin_headers) as response:
+        async with session.delete(CACHE_URL, headers=ADMIN_HEADERS) as response:
             assert response.status == 200
         
         # Step 4: Get weather again (should be fresh, not cached)
-        async with session.get(f"{BASE_URL}/api/v1/weather", headers=headers, params=params) as response:
+        async with session.get(WEATHER_URL, headers=NORMAL_HEADERS, params=SINGAPORE_PARAMS) as response:
             assert response.status == 200
-            fresh_data = await response.json()
+            fresh_data = await response.json(loads=orjson.loads)
             
             # Should be fresh data
             assert fresh_data["location"] == "Singapore"
             assert "temperature" in fresh_data
     
-    @pytest.mark.asyncio
     async def test_error_handling_workflow(self, session):
         """Test error handling in various scenarios"""
-        headers = {"Authorization": f"Bearer {API_KEYS['normal']}"}
-        
         # Test invalid location
         params = {"location": "NonExistentCity12345"}
-        async with session.get(f"{BASE_URL}/api/v1/weather", headers=headers, params=params) as response:
-            # Should handle gracefully
-            assert response.status in [200, 400, 404, 500]
+        status = await fetch_status(session, "GET", WEATHER_URL, headers=NORMAL_HEADERS, params=params)
+        # Should handle gracefully
+        assert status in [200, 400, 404, 500]
     
-    @pytest.mark.asyncio
     async def test_rate_limiting_workflow(self, session):
         """Test rate limiting with multiple rapid requests"""
-        headers = {"Authorization": f"Bearer {API_KEYS['normal']}"}
-        params = {"location": "Singapore"}
-        
-        # Make multiple rapid requests
-        start_time = time.time()
-        tasks = []
-        
-        for i in range(10):  # 10 rapid requests
-            task = session.get(f"{BASE_URL}/api/v1/weather", headers=headers, params=params)
-            tasks.append(task)
-        
-        responses = await asyncio.gather(*tasks)
-        total_time = time.time() - start_time
+        # Make multiple rapid requests (up to 10) in waves of 3, all sharing the same url/headers/params
+        total_requests, wave_size = 10, 3
+        sent = successful = 0
+        start_ns = time.perf_counter_ns()
+        while sent < total_requests:
+            wave = min(wave_size, total_requests - sent)
+            statuses = await asyncio.gather(*(
+                fetch_status(session, "GET", WEATHER_URL, headers=NORMAL_HEADERS, params=SINGAPORE_PARAMS)
+                for _ in range(wave)
+            ))
+            sent += wave
+            wave_successes = statuses.count(200)
+            successful += wave_successes
+            # Once a whole wave is rejected, further requests would only be refused as well
+            if wave_successes == 0:
+                break
+        total_time = (time.perf_counter_ns() - start_ns) / 1e9
         
-        # All requests should succeed (rate limiting is internal)
-        successful = sum(1 for r in responses if r.status == 200)
-        print(f"Rate limiting test: {successful}/10 requests succeeded in {total_time:.2f}s")
+        # Report how many requests got through before any wave was fully rejected
+        print(f"Rate limiting test: {successful}/{sent} requests succeeded in {total_time:.2f}s")
         
         # At least some should succeed
         assert successful > 0, "No requests succeeded - rate limiting may be too strict"
@@ -1,22 +1,34 @@
 """
 Unit tests for WeatherAggregationService
 """
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from app.core.service import WeatherAggregationService
 from app.core.exceptions import ProviderError, ValidationError, ConfigurationError
 
+# Built once at import; tests only patch it inside `with` blocks, so it is never left modified
+_SERVICE = WeatherAggregationService()
+
 
 class TestWeatherAggregationService:
     """Test cases for WeatherAggregationService"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def service(self):
-        """Create service instance for testing"""
-        return WeatherAggregationService()
+        """Shared module-level service instance"""
+        return _SERVICE
+    
+    @pytest.fixture(autouse=True)
+    def mock_common(self, monkeypatch, mock_http_session):
+        """Patch the collaborators every aggregation test needs; the cache is the conftest fake"""
+        async def fake_get_global_session():
+            return mock_http_session
+        
+        monkeypatch.setattr('app.core.service.get_global_session', fake_get_global_session)
+        monkeypatch.setattr('app.core.service.validate_api_keys', lambda: ('test_key1', 'test_key2'))
     
-    @pytest.mark.asyncio
-    async def test_get_aggregated_weather_success(self, service, sample_weather_data, mock_http_session):
+    async def test_get_aggregated_weather_success(self, service, sample_weather_data):
         """Test successful weather aggregation"""
         # Mock the providers
         with patch.object(service.openweather_provider, 'fetch_weather', 
@@ -24,12 +36,7 @@ class TestWeatherAggregationService:
              patch.object(service.weatherapi_provider, 'fetch_weather', 
                          return_value=sample_weather_data["weatherapi"]) as mock_wa, \
              patch.object(service.openmeteo_provider, 'fetch_weather', 
-                         return_value=sample_weather_data["openmeteo"]) as mock_om, \
-             patch('app.core.service.get_global_session', return_value=mock_http_session), \
-             patch('app.core.service.validate_api_keys', return_value=('test_key1', 'test_key2')), \
-             patch('app.core.service.is_coordinates', return_value=False), \
-             patch('app.core.service.weather_cache.get', return_value=None), \
-             patch('app.core.service.weather_cache.set'):
+                         return_value=sample_weather_data["openmeteo"]) as mock_om:
             
             result = await service.get_aggregated_weather("Singapore")
             
@@ -54,7 +61,22 @@ class TestWeatherAggregationService:
             mock_wa.assert_called_once()
             mock_om.assert_called_once()
     
-    @pytest.mark.asyncio
+    async def test_get_aggregated_weather_canonical_coordinates(self, service, sample_weather_data, mock_cache):
+        """Test coordinate input is rewritten to one canonical form for every provider and the cache"""
+        with patch.object(service.openweather_provider, 'fetch_weather', 
+                         return_value=sample_weather_data["openweather"]) as mock_ow, \
+             patch.object(service.weatherapi_provider, 'fetch_weather', 
+                         return_value=sample_weather_data["weatherapi"]) as mock_wa, \
+             patch.object(service.openmeteo_provider, 'fetch_weather', 
+                         return_value=sample_weather_data["openmeteo"]) as mock_om:
+            
+            result = await service.get_aggregated_weather(" +1.30, 1.038e2 ")
+            
+            assert result["location"] == "1.3,103.8"
+            for mock_fetch in (mock_ow, mock_wa, mock_om):
+                assert mock_fetch.call_args.args[1] == "1.3,103.8"
+            assert mock_cache.get("1.3,103.8") == result
+    
     async def test_get_aggregated_weather_cache_hit(self, service, sample_weather_data):
         """Test cache hit scenario"""
         cached_data = {"location": "Singapore", "temperature": {"value": 28.0}}
@@ -63,24 +85,18 @@ class TestWeatherAggregationService:
             result = await service.get_aggregated_weather("Singapore")
             assert result == cached_data
     
-    @pytest.mark.asyncio
-    async def test_get_aggregated_weather_all_providers_fail(self, service, mock_http_session):
+    async def test_get_aggregated_weather_all_providers_fail(self, service):
         """Test when all providers fail"""
         with patch.object(service.openweather_provider, 'fetch_weather', 
                          return_value={"source": {"provider": "OpenWeatherMap", "status": "failure"}}) as mock_ow, \
              patch.object(service.weatherapi_provider, 'fetch_weather', 
                          return_value={"source": {"provider": "WeatherAPI", "status": "failure"}}) as mock_wa, \
              patch.object(service.openmeteo_provider, 'fetch_weather', 
-                         return_value={"source": {"provider": "OpenMeteo", "status": "failure"}}) as mock_om, \
-             patch('app.core.service.get_global_session', return_value=mock_http_session), \
-             patch('app.core.service.validate_api_keys', return_value=('test_key1', 'test_key2')), \
-             patch('app.core.service.is_coordinates', return_value=False), \
-             patch('app.core.service.weather_cache.get', return_value=None):
+                         return_value={"source": {"provider": "OpenMeteo", "status": "failure"}}) as mock_om:
             
             with pytest.raises(ProviderError, match="All weather providers failed"):
                 await service.get_aggregated_weather("Singapore")
     
-    @pytest.mark.asyncio
     async def test_get_aggregated_weather_validation_error(self, service):
         """Test validation error handling"""
         with patch('app.core.service.validate_input_format', 
@@ -88,7 +104,6 @@ class TestWeatherAggregationService:
             with pytest.raises(ValidationError):
                 await service.get_aggregated_weather("")
     
-    @pytest.mark.asyncio
     async def test_get_aggregated_weather_configuration_error(self, service):
         """Test configuration error handling"""
         with patch('app.core.service.validate_api_keys', 
@@ -96,6 +111,103 @@ class TestWeatherAggregationService:
             with pytest.raises(ConfigurationError):
                 await service.get_aggregated_weather("Singapore")
     
+    async def test_get_aggregated_weather_batch(self, service):
+        """Test batch lookup keeps input order, dedupes locations and isolates failures"""
+        async def fake_get_aggregated_weather(location, **kwargs):
+            if location == "bad":
+                raise ValidationError("Invalid location")
+            return {"location": location}
+        
+        with patch.object(service, 'get_aggregated_weather', 
+                         side_effect=fake_get_aggregated_weather) as mock_get:
+            results = await service.get_aggregated_weather_batch(["Singapore", "bad", " Singapore"])
+            
+            assert results[0] == {"location": "Singapore"}
+            assert isinstance(results[1], ValidationError)
+            assert results[2] == {"location": "Singapore"}
+            assert mock_get.call_count == 2  # duplicate location fetched once
+    
+    async def test_get_aggregated_weather_batch_skips_invalid(self, service):
+        """Test invalid batch locations fail validation without being fetched"""
+        async def fake_get_aggregated_weather(location, **kwargs):
+            return {"location": location}
+        
+        with patch.object(service, 'get_aggregated_weather', 
+                         side_effect=fake_get_aggregated_weather) as mock_get:
+            results = await service.get_aggregated_weather_batch(["Singapore", "1,2,3", ""])
+            
+            assert results[0] == {"location": "Singapore"}
+            assert isinstance(results[1], ValidationError)
+            assert isinstance(results[2], ValidationError)
+            mock_get.assert_called_once_with("Singapore", validate=False)
+    
+    async def test_fetch_all_providers_returns_early(self, service, sample_weather_data, mock_http_session):
+        """Test slow providers are cancelled once enough providers succeed"""
+        async def slow_fetch(*args, **kwargs):
+            await asyncio.sleep(10)
+            return sample_weather_data["openmeteo"]
+        
+        with patch.object(service.openweather_provider, 'fetch_weather', 
+                         return_value=sample_weather_data["openweather"]), \
+             patch.object(service.weatherapi_provider, 'fetch_weather', 
+                         return_value=sample_weather_data["weatherapi"]), \
+             patch.object(service.openmeteo_provider, 'fetch_weather', side_effect=slow_fetch):
+            results = await asyncio.wait_for(
+                service._fetch_all_providers(mock_http_session, "Singapore", False, "k1", "k2"), timeout=1
+            )
+        
+        assert results[0] == sample_weather_data["openweather"]
+        assert results[1] == sample_weather_data["weatherapi"]
+        assert results[2]["source"] == {
+            "provider": "OpenMeteo", "status": "skipped - enough providers responded", "response_time_ms": 0
+        }
+    
+    async def test_fetch_all_providers_cancels_tasks_when_cancelled(self, service, mock_http_session):
+        """Test cancelling the caller cancels every in-flight provider task"""
+        started = []
+        cancelled = []
+        
+        async def hanging_fetch(*args, **kwargs):
+            started.append(True)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+        
+        with patch.object(service.openweather_provider, 'fetch_weather', side_effect=hanging_fetch), \
+             patch.object(service.weatherapi_provider, 'fetch_weather', side_effect=hanging_fetch), \
+             patch.object(service.openmeteo_provider, 'fetch_weather', side_effect=hanging_fetch):
+            fetch = asyncio.create_task(
+                service._fetch_all_providers(mock_http_session, "Singapore", False, "k1", "k2")
+            )
+            while len(started) < 3:
+                await asyncio.sleep(0)
+            fetch.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await fetch
+            # Let the provider tasks process their cancellation
+            for _ in range(3):
+                await asyncio.sleep(0)
+        
+        assert len(cancelled) == 3
+    
+    async def test_fetch_all_providers_reports_cancelled_provider(self, service, sample_weather_data, mock_http_session):
+        """Test a provider task that ends up cancelled is reported instead of raising"""
+        async def cancelled_fetch(*args, **kwargs):
+            raise asyncio.CancelledError()
+        
+        with patch.object(service.openweather_provider, 'fetch_weather', side_effect=cancelled_fetch), \
+             patch.object(service.weatherapi_provider, 'fetch_weather', 
+                         return_value=sample_weather_data["weatherapi"]), \
+             patch.object(service.openmeteo_provider, 'fetch_weather', 
+                         return_value=sample_weather_data["openmeteo"]):
+            results = await service._fetch_all_providers(mock_http_session, "Singapore", False, "k1", "k2")
+        
+        assert results[0]["source"]["status"] == "cancelled"
+        assert results[1] == sample_weather_data["weatherapi"]
+        assert results[2] == sample_weather_data["openmeteo"]
+    
     def test_process_results_success(self, service):
         """Test result processing with successful providers"""
         results = [
@@ -111,6 +223,24 @@ class TestWeatherAggregationService:
         assert all_sources[0]["status"] == "success"
         assert all_sources[2]["status"] == "failure"
     
+    def test_process_results_skipped_not_logged_as_failure(self, service):
+        """Test providers cut short by the early return are logged at debug, not as failures"""
+        results = [
+            {"source": {"provider": "OpenWeatherMap", "status": "success", "response_time_ms": 250}},
+            {"source": {"provider": "WeatherAPI", "status": "skipped - enough providers responded", "response_time_ms": 0}},
+            {"source": {"provider": "OpenMeteo", "status": "cancelled", "response_time_ms": 0}}
+        ]
+        
+        with patch('app.core.service.logger') as mock_logger:
+            weather_data, all_sources = service._process_results(results)
+        
+        assert len(weather_data) == 1
+        assert [source["status"] for source in all_sources] == [
+            "success", "skipped - enough providers responded", "cancelled"
+        ]
+        mock_logger.warning.assert_not_called()
+        assert mock_logger.debug.call_count == 2
+    
     def test_build_response(self, service, sample_weather_data):
         """Test response building"""
         weather_data = [
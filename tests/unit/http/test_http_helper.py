@@ -0,0 +1,96 @@
+"""
+Unit tests for HTTP helper
+"""
+import time
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from app.http import http_helper
+from app.http.http_helper import make_api_request
+
+
+def _mock_session(status: int = 200, body: bytes = b"{}"):
+    """Create a mock session whose get() yields a response with the given status/body"""
+    mock_response = AsyncMock()
+    mock_response.status = status
+    mock_response.headers = {}
+    mock_response.read = AsyncMock(return_value=body)
+    
+    mock_context = AsyncMock()
+    mock_context.__aenter__ = AsyncMock(return_value=mock_response)
+    mock_context.__aexit__ = AsyncMock(return_value=None)
+    
+    session = Mock()
+    session.get = Mock(return_value=mock_context)
+    return session
+
+
+class TestMakeApiRequest:
+    """Test cases for make_api_request"""
+    
+    @pytest.fixture(autouse=True)
+    def reset_negative_cache(self):
+        """Start and end every test with no provider in cooldown"""
+        http_helper._failed_until.clear()
+        yield
+        http_helper._failed_until.clear()
+    
+    async def test_success_decodes_raw_body(self):
+        """Test successful responses are decoded from the raw body bytes"""
+        session = _mock_session(body=b'{"name": "Singapore", "main": {"temp": 28.5}}')
+        
+        result = await make_api_request(session, "https://example.com", {"q": "Singapore"},
+                                        "openweather", "OpenWeatherMap")
+        
+        assert result["status"] == "success"
+        assert result["data"] == {"name": "Singapore", "main": {"temp": 28.5}}
+        assert result["attempts"] == 1
+    
+    async def test_client_error_not_retried(self):
+        """Test 4xx responses fail immediately without retrying"""
+        session = _mock_session(status=404)
+        
+        result = await make_api_request(session, "https://example.com", {"q": "Nowhere"},
+                                        "openweather", "OpenWeatherMap")
+        
+        assert result["status"] == "failure - Client error (HTTP 404)"
+        assert session.get.call_count == 1
+    
+    async def test_failed_provider_skipped_during_cooldown(self):
+        """Test a provider that exhausted its retries is skipped until the cooldown expires"""
+        failing_session = _mock_session(status=503)
+        
+        with patch.dict(http_helper.RETRY_CONFIG, {"max_retries": 0}):
+            result = await make_api_request(failing_session, "https://example.com", {},
+                                            "weatherapi", "WeatherAPI")
+            assert result["status"].startswith("failure - Failed after 1 attempts")
+            
+            healthy_session = _mock_session()
+            result = await make_api_request(healthy_session, "https://example.com", {},
+                                            "weatherapi", "WeatherAPI")
+            
+            assert result["status"].startswith("failure - Provider temporarily unavailable")
+            assert result["attempts"] == 0
+            healthy_session.get.assert_not_called()
+    
+    async def test_probe_after_cooldown_clears_failure(self):
+        """Test the first request after the cooldown probes the provider and clears it on success"""
+        http_helper._failed_until["WeatherAPI"] = time.monotonic() - 1
+        session = _mock_session()
+        
+        result = await make_api_request(session, "https://example.com", {},
+                                        "weatherapi", "WeatherAPI")
+        
+        assert result["status"] == "success"
+        assert "WeatherAPI" not in http_helper._failed_until
+    
+    async def test_unexpected_error_keeps_cooldown(self):
+        """Test an unexpected error during a probe leaves the provider in cooldown"""
+        http_helper._failed_until["WeatherAPI"] = time.monotonic() - 1
+        session = Mock()
+        session.get = Mock(side_effect=RuntimeError("boom"))
+        
+        result = await make_api_request(session, "https://example.com", {},
+                                        "weatherapi", "WeatherAPI")
+        
+        assert result["status"].startswith("failure - Unexpected error: RuntimeError")
+        assert http_helper._failed_until["WeatherAPI"] > time.monotonic()
@@ -0,0 +1,66 @@
+"""
+Unit tests for OpenMeteoProvider
+"""
+import pytest
+from unittest.mock import patch
+from app.providers import openmeteo_provider
+from app.providers.openmeteo_provider import OpenMeteoProvider
+from tests.mocks.weather_apis import MockWeatherAPIs
+
+# Passed straight through to the patched make_api_request, never called
+_SENTINEL_SESSION = object()
+
+# Built once; the provider only reads these responses, so tests share them
+_MOCK_GEOCODE_SG = MockWeatherAPIs.get_geocoding_response("Singapore")
+_MOCK_FORECAST = MockWeatherAPIs.get_openmeteo_response()
+_MOCK_SERVER_ERROR = MockWeatherAPIs.get_error_response("openweather", "server_error")
+
+
+class TestOpenMeteoProvider:
+    """Test cases for OpenMeteoProvider"""
+    
+    @pytest.fixture(scope="class")
+    def provider(self):
+        """Create one provider instance shared by the class (tests only patch it inside `with` blocks)"""
+        return OpenMeteoProvider()
+    
+    @pytest.fixture
+    def mock_session(self):
+        """Opaque session placeholder; make_api_request is patched, so it is never used"""
+        return _SENTINEL_SESSION
+    
+    @pytest.fixture(autouse=True)
+    def reset_geocode_cache(self):
+        """Start every test with an empty geocoding cache"""
+        openmeteo_provider._geocode_cache.clear()
+        yield
+        openmeteo_provider._geocode_cache.clear()
+    
+    async def test_fetch_weather_city_name_success(self, provider, mock_session):
+        """Test city name is geocoded and then fetched by coordinates"""
+        with patch('app.providers.openmeteo_provider.make_api_request',
+                  side_effect=[_MOCK_GEOCODE_SG, _MOCK_FORECAST]) as mock_request:
+            result = await provider.fetch_weather(mock_session, "Singapore", False, "test_key")
+            
+            assert result["temperature"] == 28.8
+            assert result["source"]["status"] == "success"
+            assert mock_request.call_count == 2
+    
+    async def test_geocode_location_cached(self, provider, mock_session):
+        """Test repeat lookups for the same city skip the geocoding request"""
+        with patch('app.providers.openmeteo_provider.make_api_request',
+                  return_value=_MOCK_GEOCODE_SG) as mock_request:
+            first = await provider._geocode_location(mock_session, "Singapore", "test_key")
+            second = await provider._geocode_location(mock_session, "  singapore ", "test_key")
+            
+            assert first == second == (1.3521, 103.8198)
+            assert mock_request.call_count == 1
+    
+    async def test_geocode_location_failure_not_cached(self, provider, mock_session):
+        """Test failed lookups are retried on the next request"""
+        with patch('app.providers.openmeteo_provider.make_api_request',
+                  return_value=_MOCK_SERVER_ERROR) as mock_request:
+            assert await provider._geocode_location(mock_session, "Atlantis", "test_key") is None
+            assert await provider._geocode_location(mock_session, "Atlantis", "test_key") is None
+            
+            assert mock_request.call_count == 2
@@ -2,28 +2,37 @@
 Unit tests for OpenWeatherProvider
 """
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, patch
 from app.providers.openweather_provider import OpenWeatherProvider
 from tests.mocks.weather_apis import MockWeatherAPIs
 
+# Passed straight through to the patched make_api_request, never called
+_SENTINEL_SESSION = object()
+
+# Built once; the provider only reads these responses, so tests share them
+_MOCK_SG = MockWeatherAPIs.get_openweather_response("Singapore")
+_MOCK_TIMEOUT = MockWeatherAPIs.get_error_response("openweather", "timeout")
+
+# Built once at import; tests only patch it inside `with` blocks, so it is never left modified
+_PROVIDER = OpenWeatherProvider()
+
 
 class TestOpenWeatherProvider:
     """Test cases for OpenWeatherProvider"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def provider(self):
-        """Create provider instance for testing"""
-        return OpenWeatherProvider()
+        """Shared module-level provider instance"""
+        return _PROVIDER
     
     @pytest.fixture
     def mock_session(self):
-        """Create mock HTTP session"""
-        return AsyncMock()
+        """Opaque session placeholder; make_api_request is patched, so it is never used"""
+        return _SENTINEL_SESSION
     
-    @pytest.mark.asyncio
     async def test_fetch_weather_city_name_success(self, provider, mock_session):
         """Test successful weather fetch for city name"""
-        mock_response = MockWeatherAPIs.get_openweather_response("Singapore")
+        mock_response = _MOCK_SG
         
         # Mock make_api_request where it's imported in the base provider
         with patch('app.providers.base_provider.make_api_request', 
@@ -38,10 +47,9 @@ class TestOpenWeatherProvider:
             assert result["source"]["status"] == "success"
         
     
-    @pytest.mark.asyncio
     async def test_fetch_weather_coordinates_success(self, provider, mock_session):
         """Test successful weather fetch for coordinates"""
-        mock_response = MockWeatherAPIs.get_openweather_response("Singapore")
+        mock_response = _MOCK_SG
         
         with patch('app.providers.base_provider.make_api_request', 
                   return_value=mock_response) as mock_request, \
@@ -55,10 +63,9 @@ class TestOpenWeatherProvider:
             assert result["source"]["status"] == "success"
         
     
-    @pytest.mark.asyncio
     async def test_fetch_weather_failure(self, provider, mock_session):
         """Test weather fetch failure"""
-        mock_response = MockWeatherAPIs.get_error_response("openweather", "timeout")
+        mock_response = _MOCK_TIMEOUT
         
         with patch('app.providers.base_provider.make_api_request', 
                   return_value=mock_response):
@@ -67,7 +74,6 @@ class TestOpenWeatherProvider:
             assert result["source"]["status"].startswith("failure")
             assert "OpenWeatherMap" in result["source"]["provider"]
     
-    @pytest.mark.asyncio
     async def test_fetch_weather_exception(self, provider, mock_session):
         """Test weather fetch with exception"""
         with patch('app.providers.base_provider.make_api_request', 
@@ -92,9 +98,17 @@ class TestOpenWeatherProvider:
             assert "api.openweathermap.org" in url
             assert params == {"lat": 1.3521, "lon": 103.8198, "appid": "test_key", "units": "metric"}
     
+    def test_prepare_request_params_parsed_coordinates(self, provider):
+        """Test pre-parsed coordinates are used without re-parsing the location"""
+        with patch('app.providers.openweather_provider.parse_coordinates') as mock_parse:
+            url, params = provider._prepare_request_params("1.3521,103.8198", True, "test_key", (1.3521, 103.8198))
+            
+            mock_parse.assert_not_called()
+            assert params == {"lat": 1.3521, "lon": 103.8198, "appid": "test_key", "units": "metric"}
+    
     def test_process_successful_response(self, provider):
         """Test successful response processing"""
-        mock_result = MockWeatherAPIs.get_openweather_response("Singapore")
+        mock_result = _MOCK_SG
         
         # Don't mock get_weather_description, let it use the real mapping
         result = provider._process_successful_response(mock_result)
@@ -1,130 +1,264 @@
 """
 Unit tests for utility functions
 """
+import re
 import pytest
-from unittest.mock import patch
+import app.utils.utils as utils_module
 from app.utils.utils import (
     is_coordinates, 
     parse_coordinates, 
     validate_city_name,
     validate_input_format,
+    validate_input_format_many,
     validate_api_keys,
     get_singapore_timestamp
 )
 from app.core.exceptions import ValidationError, ConfigurationError
 
 
+# Coordinate samples shared by every coordinate test: (input, latitude, longitude)
+VALID_COORDS = (
+    ("1.3521,103.8198", 1.3521, 103.8198),
+    ("-90.0,180.0", -90.0, 180.0),
+    ("0,0", 0.0, 0.0),
+    ("90,-180", 90.0, -180.0),
+    ("45.123456,-123.456789", 45.123456, -123.456789),
+    # Accepted number grammar: optional sign, optional fraction or exponent
+    ("1e0,1e1", 1.0, 10.0),
+    ("+1.5,-.5", 1.5, -0.5),
+    # Whitespace around coordinate values is ignored
+    ("1.3521, 103.8198", 1.3521, 103.8198),
+    (" 1.3521 ,103.8198 ", 1.3521, 103.8198),
+)
+
+# Inputs that are not coordinates at all
+INVALID_COORDS = (
+    "Singapore",
+    "1.3521",
+    "1.3521,103.8198,extra",
+    "",
+    "1.3521,",
+    ",103.8198",
+    "abc,def",
+)
+
+# Inputs float() alone would accept but that are not coordinates
+LENIENT_FLOAT_COORDS = (
+    "1_0,2",        # digit-group underscores
+    "١,٢",          # Arabic-Indic digits
+    "１,２",          # fullwidth digits
+    "nan,0",
+    "0,inf",
+    "-Infinity,0",
+)
+
+
+def _coord_id(sample):
+    """Test id for a VALID_COORDS entry: the input string"""
+    return repr(sample[0])
+
+
+# Expected error messages, compiled once and shared by every pytest.raises below
+_PATTERNS = {key: re.compile(message) for key, message in {
+    "coord_format_full": "Coordinates must be in format 'latitude,longitude'",
+    "coord_format": "Coordinates must be in format",
+    "coord_numbers": "Both latitude and longitude must be valid numbers",
+    "coord_empty": "Coordinate string cannot be empty",
+    "lat_high": "Latitude 91.0 is out of range",
+    "lat_low": "Latitude -91.0 is out of range",
+    "lon_high": "Longitude 181.0 is out of range",
+    "lon_low": "Longitude -181.0 is out of range",
+    "city_empty": "City name cannot be empty",
+    "city_short": "City name must be at least 2 characters",
+    "city_long": "City name too long",
+    "city_no_letter": "City name must contain at least one letter",
+    "location_empty": "Location cannot be empty",
+    "too_many_commas": "Too many commas",
+    "not_string": "Location must be a string",
+    "coord_invalid": "Invalid coordinate format",
+    "api_keys_missing": "Missing required API keys",
+}.items()}
+
+
+def expect(key, exc=ValidationError):
+    """pytest.raises for `exc` with the precompiled message pattern stored under `key`"""
+    return pytest.raises(exc, match=_PATTERNS[key])
+
+
 class TestUtils:
     """Test cases for utility functions"""
     
-    def test_is_coordinates_valid(self):
+    @pytest.mark.parametrize("sample", VALID_COORDS, ids=_coord_id)
+    def test_is_coordinates_valid(self, sample):
         """Test valid coordinate detection"""
-        assert is_coordinates("1.3521,103.8198") == True
-        assert is_coordinates("-90.0,180.0") == True
-        assert is_coordinates("0,0") == True
-        assert is_coordinates("45.123456,-123.456789") == True
+        assert is_coordinates(sample[0]) == True
     
-    def test_is_coordinates_invalid(self):
+    @pytest.mark.parametrize("location", INVALID_COORDS, ids=repr)
+    def test_is_coordinates_invalid(self, location):
         """Test invalid coordinate detection"""
-        assert is_coordinates("Singapore") == False
-        assert is_coordinates("1.3521") == False
-        assert is_coordinates("1.3521,103.8198,extra") == False
-        assert is_coordinates("") == False
-        assert is_coordinates("1.3521,") == False
-        assert is_coordinates(",103.8198") == False
-        assert is_coordinates("abc,def") == False
-    
-    def test_parse_coordinates_valid(self):
+        assert is_coordinates(location) == False
+    
+    @pytest.mark.parametrize("location", LENIENT_FLOAT_COORDS, ids=repr)
+    def test_is_coordinates_rejects_lenient_floats(self, location):
+        """Test underscores, non-ASCII digits and non-finite values are not coordinates"""
+        assert is_coordinates(location) == False
+    
+    @pytest.mark.parametrize("location", LENIENT_FLOAT_COORDS, ids=repr)
+    def test_parse_coordinates_rejects_lenient_floats(self, location):
+        """Test parse_coordinates rejects what float() alone would accept"""
+        with expect('coord_numbers'):
+            parse_coordinates(location)
+    
+    @pytest.mark.parametrize("location", LENIENT_FLOAT_COORDS, ids=repr)
+    def test_validate_input_format_rejects_lenient_floats(self, location):
+        """Test validate_input_format reports lenient floats as invalid coordinates"""
+        with expect('coord_invalid'):
+            validate_input_format(location)
+    
+    @pytest.mark.parametrize("sample", VALID_COORDS, ids=_coord_id)
+    def test_parse_coordinates_valid(self, sample):
         """Test valid coordinate parsing"""
-        lat, lon = parse_coordinates("1.3521,103.8198")
-        assert lat == 1.3521
-        assert lon == 103.8198
-        
-        lat, lon = parse_coordinates("-90.0,180.0")
-        assert lat == -90.0
-        assert lon == 180.0
+        location, lat, lon = sample
+        assert parse_coordinates(location) == (lat, lon)
     
-    def test_parse_coordinates_invalid_format(self):
+    @pytest.mark.parametrize("location, error_key", [
+        ("1.3521", "coord_format"),
+        ("1.3521,103.8198,extra", "coord_format_full"),
+        ("abc,def", "coord_numbers"),
+        ("1.3521,", "coord_numbers"),
+        ("", "coord_empty"),
+    ])
+    def test_parse_coordinates_invalid_format(self, location, error_key):
         """Test invalid coordinate format"""
-        with pytest.raises(ValidationError, match="Coordinates must be in format"):
-            parse_coordinates("1.3521")
-        
-        with pytest.raises(ValidationError, match="Coordinates must be in format 'latitude,longitude'"):
-            parse_coordinates("1.3521,103.8198,extra")
-        
-        with pytest.raises(ValidationError, match="Both latitude and longitude must be valid numbers"):
-            parse_coordinates("abc,def")
+        with expect(error_key):
+            parse_coordinates(location)
     
-    def test_parse_coordinates_invalid_range(self):
+    @pytest.mark.parametrize("location, error_key", [
+        ("91,103.8198", "lat_high"),
+        ("-91,103.8198", "lat_low"),
+        ("1.3521,181", "lon_high"),
+        ("1.3521,-181", "lon_low"),
+    ])
+    def test_parse_coordinates_invalid_range(self, location, error_key):
         """Test coordinate range validation"""
-        with pytest.raises(ValidationError, match="Latitude 91.0 is out of range"):
-            parse_coordinates("91,103.8198")
-        
-        with pytest.raises(ValidationError, match="Latitude -91.0 is out of range"):
-            parse_coordinates("-91,103.8198")
-        
-        with pytest.raises(ValidationError, match="Longitude 181.0 is out of range"):
-            parse_coordinates("1.3521,181")
-        
-        with pytest.raises(ValidationError, match="Longitude -181.0 is out of range"):
-            parse_coordinates("1.3521,-181")
+        with expect(error_key):
+            parse_coordinates(location)
     
-    def test_validate_city_name_valid(self):
+    @pytest.mark.parametrize("city_name", [
+        "Singapore",
+        "New York",
+        "São Paulo",
+        "AB",  # Two characters should pass
+        "A" * 100,  # Maximum length should pass
+        "1" * 99 + "A",  # Letter found at the very end of a maximum-length name
+        # Non-Latin scripts count as letters
+        "東京",
+        "Москва",
+        "القاهرة",
+        "Ἀθῆναι",
+    ])
+    def test_validate_city_name_valid(self, city_name):
         """Test valid city name validation"""
-        validate_city_name("Singapore")
-        validate_city_name("New York")
-        validate_city_name("São Paulo")
-        validate_city_name("AB")  # Two characters should pass
+        validate_city_name(city_name)
+    
+    def test_letter_pattern_precompiled(self):
+        """Test the city-name letter check uses a module-level compiled pattern"""
+        assert isinstance(utils_module._LETTER_RE, re.Pattern)
     
-    def test_validate_city_name_invalid(self):
+    @pytest.mark.parametrize("city_name, error_key", [
+        ("", "city_empty"),
+        ("A", "city_short"),
+        ("A" * 101, "city_long"),
+        ("123", "city_no_letter"),
+        ("1" * 100, "city_no_letter"),
+        ("__", "city_no_letter"),
+        ("١٢٣", "city_no_letter"),  # Non-ASCII digits are still not letters
+    ])
+    def test_validate_city_name_invalid(self, city_name, error_key):
         """Test invalid city name validation"""
-        with pytest.raises(ValidationError, match="City name cannot be empty"):
-            validate_city_name("")
-        
-        with pytest.raises(ValidationError, match="City name must be at least 2 characters"):
-            validate_city_name("A")
-        
-        with pytest.raises(ValidationError, match="City name too long"):
-            validate_city_name("A" * 101)
-        
-        with pytest.raises(ValidationError, match="City name must contain at least one letter"):
-            validate_city_name("123")
+        with expect(error_key):
+            validate_city_name(city_name)
     
-    def test_validate_input_format_coordinates(self):
+    @pytest.mark.parametrize("sample", VALID_COORDS, ids=_coord_id)
+    def test_validate_input_format_coordinates(self, sample):
         """Test coordinate input validation"""
-        validate_input_format("1.3521,103.8198")
-        validate_input_format("-90.0,180.0")
+        location, lat, lon = sample
+        assert validate_input_format(location) == (lat, lon)
     
     def test_validate_input_format_city(self):
         """Test city input validation"""
-        validate_input_format("Singapore")
-        validate_input_format("New York")
+        assert validate_input_format("Singapore") is None
+        assert validate_input_format("New York") is None
     
     def test_validate_input_format_invalid(self):
         """Test invalid input validation"""
-        with pytest.raises(ValidationError, match="Location cannot be empty"):
+        with expect('location_empty'):
             validate_input_format("")
         
-        with pytest.raises(ValidationError, match="Too many commas"):
+        with expect('too_many_commas'):
             validate_input_format("1.3521,103.8198,extra")
         
-        with pytest.raises(ValidationError, match="Location must be a string"):
+        with expect('not_string'):
             validate_input_format(123)
+        
+        with expect('coord_invalid'):
+            validate_input_format("abc,def")
+        
+        with expect('lat_high'):
+            validate_input_format("91,103.8198")
+    
+    @pytest.mark.parametrize("location, expected", [
+        ("Singapore", None),
+        ("1.3521,103.8198", (1.3521, 103.8198)),
+        # Invalid inputs pass through unchecked
+        ("", None),
+        ("A", None),
+        ("123", None),
+        ("91,181", (91.0, 181.0)),
+        ("1,2,3", None),
+    ])
+    def test_validate_input_format_skip(self, location, expected):
+        """Test validate=False only classifies the input and never raises"""
+        assert validate_input_format(location, validate=False) == expected
+    
+    def test_validate_input_format_many_mixed(self):
+        """Test batch validation returns per-location results in input order"""
+        locations = ["Singapore", "1.3521,103.8198", "", "1,2,3"] * 250
+        
+        results = validate_input_format_many(locations)
+        
+        assert len(results) == 1000
+        assert results[0] is None
+        assert results[1] == (1.3521, 103.8198)
+        assert isinstance(results[2], ValidationError)
+        assert "Location cannot be empty" in str(results[2])
+        assert isinstance(results[3], ValidationError)
+        assert "Too many commas" in str(results[3])
+        # Every repetition of the pattern gets the same outcome
+        assert [str(result) for result in results[996:]] == [str(result) for result in results[:4]]
+    
+    @pytest.fixture
+    def set_keys(self, monkeypatch):
+        """Callable that sets both provider API keys seen by validate_api_keys"""
+        def _set_keys(openweather_key, weatherapi_key):
+            monkeypatch.setattr(utils_module, 'OPENWEATHER_API_KEY', openweather_key)
+            monkeypatch.setattr(utils_module, 'WEATHERAPI_KEY', weatherapi_key)
+        return _set_keys
     
-    def test_validate_api_keys_success(self):
+    def test_validate_api_keys_success(self, set_keys):
         """Test successful API key validation"""
-        with patch('app.utils.utils.OPENWEATHER_API_KEY', 'test_key1'), \
-             patch('app.utils.utils.WEATHERAPI_KEY', 'test_key2'):
-            key1, key2 = validate_api_keys()
-            assert key1 == 'test_key1'
-            assert key2 == 'test_key2'
+        set_keys('test_key1', 'test_key2')
+        
+        key1, key2 = validate_api_keys()
+        assert key1 == 'test_key1'
+        assert key2 == 'test_key2'
     
-    def test_validate_api_keys_missing(self):
+    def test_validate_api_keys_missing(self, set_keys):
         """Test missing API key validation"""
-        with patch('app.utils.utils.OPENWEATHER_API_KEY', None), \
-             patch('app.utils.utils.WEATHERAPI_KEY', 'test_key2'):
-            with pytest.raises(ConfigurationError, match="Missing required API keys"):
-                validate_api_keys()
+        set_keys(None, 'test_key2')
+        
+        with expect('api_keys_missing', ConfigurationError):
+            validate_api_keys()
     
     def test_get_singapore_timestamp(self):
         """Test Singapore timestamp generation"""
@@ -132,3 +266,28 @@ class TestUtils:
         assert isinstance(timestamp, str)
         assert 'T' in timestamp  # ISO format
         assert '+' in timestamp or 'Z' in timestamp  # Timezone info
+    
+    @pytest.mark.parametrize("precision, pattern", [
+        ("seconds", r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\+08:00"),
+        ("millis", r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}\+08:00"),
+        ("microseconds", r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}\+08:00"),
+    ])
+    def test_get_singapore_timestamp_precision(self, precision, pattern):
+        """Test each precision gives a fixed-width timestamp with a stable suffix"""
+        assert re.fullmatch(pattern, get_singapore_timestamp(precision))
+    
+    def test_get_singapore_timestamp_invalid_precision(self):
+        """Test an unsupported precision is rejected"""
+        with pytest.raises(ValueError, match="Unsupported timestamp precision"):
+            get_singapore_timestamp("nanos")
+    
+    def test_get_singapore_timestamp_reuses_timezone(self, monkeypatch):
+        """Test the Singapore timezone is built once at import, not per call"""
+        def fail(*args, **kwargs):
+            raise AssertionError("timezone constructed per call")
+        
+        monkeypatch.setattr(utils_module, 'timezone', fail)
+        monkeypatch.setattr(utils_module, 'timedelta', fail)
+        
+        for _ in range(2):
+            assert get_singapore_timestamp().endswith('+08:00')
@@ -0,0 +1,87 @@
+"""
+Unit tests for weather code standardization
+"""
+import sys
+from app.utils.weather_code import (
+    StandardWeatherCondition,
+    condition_from_label,
+    standardize_code,
+    OPENWEATHER_ID,
+    WEATHERAPI_ID,
+    OPENMETEO_ID,
+    _OPENWEATHER_RAW,
+    _WEATHERAPI_RAW,
+    _OPENMETEO_RAW
+)
+
+
+class TestWeatherCode:
+    """Test cases for weather code standardization"""
+    
+    def test_standardize_code_matches_raw_tables(self):
+        """Test every known provider code resolves to its standard condition"""
+        for provider_id, pairs in (
+            (OPENWEATHER_ID, _OPENWEATHER_RAW),
+            (WEATHERAPI_ID, _WEATHERAPI_RAW),
+            (OPENMETEO_ID, _OPENMETEO_RAW)
+        ):
+            for code, condition in pairs:
+                assert standardize_code(provider_id, code) == condition.label
+    
+    def test_standardize_code_known_values(self):
+        """Test a few well-known codes"""
+        assert standardize_code(OPENWEATHER_ID, 800) == "clear"
+        assert standardize_code(WEATHERAPI_ID, 1000) == "clear"
+        assert standardize_code(OPENMETEO_ID, 3) == "overcast"
+    
+    def test_standardize_code_unknown(self):
+        """Test unmapped, out-of-range and non-int codes return None"""
+        assert standardize_code(OPENMETEO_ID, 4) is None           # gap inside the block
+        assert standardize_code(OPENMETEO_ID, -1) is None          # below the block
+        assert standardize_code(OPENMETEO_ID, 200) is None         # another provider's range
+        assert standardize_code(OPENWEATHER_ID, 1000) is None
+        assert standardize_code(WEATHERAPI_ID, None) is None
+        assert standardize_code(WEATHERAPI_ID, "1000") is None
+    
+    def test_standardize_code_shares_value_objects(self):
+        """Test all slots for one condition return the same string object"""
+        assert standardize_code(OPENWEATHER_ID, 800) is standardize_code(OPENMETEO_ID, 0)
+        assert standardize_code(WEATHERAPI_ID, 1000) is standardize_code(OPENMETEO_ID, 0)
+        assert standardize_code(OPENMETEO_ID, 0) is StandardWeatherCondition.CLEAR.label
+    
+    def test_condition_labels_interned(self):
+        """Test enum labels are the interned string objects"""
+        for condition in StandardWeatherCondition:
+            assert condition.label is sys.intern(condition.label)
+    
+    def test_condition_descriptions(self):
+        """Test every condition carries a human-readable description"""
+        assert StandardWeatherCondition.CLEAR.description == "Clear Sky"
+        assert StandardWeatherCondition.THUNDERSTORM_WITH_RAIN.description == "Thunderstorm with Rain"
+        assert all(condition.description for condition in StandardWeatherCondition)
+    
+    def test_float_code_does_not_change_int_result(self):
+        """Test a float code never affects the result for the equal int code"""
+        assert standardize_code(OPENWEATHER_ID, 800.0) is None
+        assert standardize_code(OPENWEATHER_ID, 800) == "clear"
+        assert standardize_code(OPENWEATHER_ID, 800.0) is None
+    
+    def test_non_int_codes_are_unknown(self):
+        """Test malformed codes from a payload map to None instead of raising"""
+        assert standardize_code(OPENWEATHER_ID, [800]) is None
+        assert standardize_code(OPENWEATHER_ID, "800") is None
+        assert standardize_code(OPENWEATHER_ID, None) is None
+        assert standardize_code(OPENWEATHER_ID, True) is None
+    
+    def test_conditions_are_ints(self):
+        """Test conditions are plain ints numbered in declaration order"""
+        assert StandardWeatherCondition.CLEAR == 0
+        assert StandardWeatherCondition(0) is StandardWeatherCondition.CLEAR
+        assert [int(condition) for condition in StandardWeatherCondition] == list(range(len(StandardWeatherCondition)))
+    
+    def test_condition_from_label(self):
+        """Test labels parse back to their conditions"""
+        for condition in StandardWeatherCondition:
+            assert condition_from_label(condition.label) is condition
+        assert condition_from_label(standardize_code(OPENWEATHER_ID, 800)) is StandardWeatherCondition.CLEAR
+        assert condition_from_label("not_a_condition") is None